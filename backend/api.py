@@ -1,5 +1,6 @@
 """FastAPI REST API for AI Flight Recorder."""
 
+from contextlib import asynccontextmanager
 from typing import Optional
 
 from fastapi import FastAPI, HTTPException, Query, Depends, Header
@@ -31,11 +32,19 @@ from backend.models import (
 )
 from backend.zk_proofs import ZKCommitmentStore
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Flush buffered transparency ledger writes on shutdown."""
+    yield
+    transparency_ledger.flush()
+
+
 # Initialize FastAPI app
 app = FastAPI(
     title="AI Governance Transparency Ledger",
     description="Shared transparency ledger for frontier AI compliance verification",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
 # Add CORS middleware
@@ -542,7 +551,8 @@ from backend.models import (
 )
 from backend.transparency import TransparencyLedger
 
-# Initialize transparency ledger
+# Initialize transparency ledger; the default write-through mode appends every
+# accepted mutation to the log before the response is sent
 transparency_ledger = TransparencyLedger(storage_path="data/transparency_ledger.json")
 
 
@@ -928,6 +938,24 @@ async def get_deployment_compliance_status(
     return transparency_ledger.get_deployment_compliance_status(deployment_id, model_id)
 
 
+@app.get("/compliance/cleared/{deployment_id}")
+async def is_deployment_cleared(
+    deployment_id: str,
+    model_id: str
+):
+    """
+    Check only whether a deployment passes the deployment gate.
+
+    Same decision as /compliance/status/{deployment_id}, without the
+    per-template and per-concern breakdown.
+    """
+    return {
+        "deployment_id": deployment_id,
+        "model_id": model_id,
+        "is_cleared": transparency_ledger.is_deployment_cleared(deployment_id, model_id)
+    }
+
+
 @app.get("/compliance/templates")
 async def get_template_types():
     """
@@ -14,6 +14,8 @@ from fastapi import Header, HTTPException, Depends, Request
 class AuthorizedParty:
     """Represents an authorized party in the system."""
 
+    __slots__ = ("party_id", "name", "role", "api_key_hash", "created_at", "is_active")
+
     def __init__(
         self,
         party_id: str,
@@ -62,6 +64,8 @@ class AuthStore:
     def __init__(self, storage_path: str = "data/auth_store.json"):
         self.storage_path = Path(storage_path)
         self.parties: dict[str, AuthorizedParty] = {}
+        # API key hash -> party ID, so key verification is a single lookup
+        self._by_key_hash: dict[str, str] = {}
         self._load()
 
     def _load(self) -> None:
@@ -75,6 +79,7 @@ class AuthStore:
                         for party_data in data.get("parties", []):
                             party = AuthorizedParty.from_dict(party_data)
                             self.parties[party.party_id] = party
+                            self._by_key_hash[party.api_key_hash] = party.party_id
             except json.JSONDecodeError:
                 # File exists but is empty or invalid - start fresh
                 pass
@@ -134,6 +139,7 @@ class AuthStore:
         )
 
         self.parties[party_id] = party
+        self._by_key_hash[api_key_hash] = party_id
         self._save()
 
         return party_id, api_key
@@ -148,13 +154,12 @@ class AuthStore:
         Returns:
             AuthorizedParty if valid, None otherwise
         """
-        api_key_hash = self._hash_api_key(api_key)
-
-        for party in self.parties.values():
-            if party.api_key_hash == api_key_hash and party.is_active:
-                return party
+        party_id = self._by_key_hash.get(self._hash_api_key(api_key))
+        if party_id is None:
+            return None
 
-        return None
+        party = self.parties[party_id]
+        return party if party.is_active else None
 
     def revoke_party(self, party_id: str) -> bool:
         """
@@ -207,7 +212,9 @@ class AuthStore:
         new_api_key_hash = self._hash_api_key(new_api_key)
 
         # Update the party's key hash
+        del self._by_key_hash[party.api_key_hash]
         party.api_key_hash = new_api_key_hash
+        self._by_key_hash[new_api_key_hash] = party_id
         self._save()
 
         return new_api_key
@@ -215,6 +222,7 @@ class AuthStore:
     def reset(self) -> None:
         """Reset the auth store (for testing/demo)."""
         self.parties = {}
+        self._by_key_hash = {}
         self._save()
 
 
@@ -1,7 +1,10 @@
 """Cryptographic utilities for tamper-proof audit logging."""
 
+import functools
 import hashlib
+import hmac
 import json
+import os
 from typing import Any, Optional
 
 
@@ -89,6 +92,18 @@ def combine_hashes(left: str, right: str) -> str:
     return hashlib.sha256(combined.encode('utf-8')).hexdigest()
 
 
+def _derive_anonymous_id(identity: str, salt: str) -> str:
+    """Derive the anonymous ID for an identity/salt pair."""
+    combined = f"{identity}||{salt}"
+    full_hash = hashlib.sha256(combined.encode('utf-8')).hexdigest()
+    return f"anon_{full_hash[:12]}"
+
+
+# Opt-in memoization for test runs; off by default so salts are not kept in memory
+if os.environ.get("LEDGER_CACHE_IDS") == "1":
+    _derive_anonymous_id = functools.lru_cache(maxsize=1024)(_derive_anonymous_id)
+
+
 def generate_anonymous_id(identity: str, salt: str) -> str:
     """
     Generate an anonymous but consistent ID for a whistleblower.
@@ -103,9 +118,7 @@ def generate_anonymous_id(identity: str, salt: str) -> str:
     Returns:
         Anonymous ID (first 16 chars of hash for readability)
     """
-    combined = f"{identity}||{salt}"
-    full_hash = hashlib.sha256(combined.encode('utf-8')).hexdigest()
-    return f"anon_{full_hash[:12]}"
+    return _derive_anonymous_id(identity, salt)
 
 
 def verify_anonymous_id(identity: str, salt: str, anonymous_id: str) -> bool:
@@ -123,5 +136,5 @@ def verify_anonymous_id(identity: str, salt: str, anonymous_id: str) -> bool:
     Returns:
         True if the identity/salt produces this anonymous ID
     """
-    computed = generate_anonymous_id(identity, salt)
-    return computed == anonymous_id
+    computed = _derive_anonymous_id(identity, salt)
+    return hmac.compare_digest(computed.encode('utf-8'), anonymous_id.encode('utf-8'))
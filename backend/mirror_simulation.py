@@ -18,13 +18,14 @@ class MirrorSimulation:
     - Tamper detection through hash comparison
     - What happens when one party tries to modify records
 
-    Data is persisted to disk for durability across restarts.
+    Data is persisted to disk for durability across restarts. Pass
+    storage_path=None to keep mirrors in memory only.
     """
 
     PARTIES = ["lab", "auditor", "government"]
 
-    def __init__(self, storage_path: str = "data/mirror_store.json"):
-        self.storage_path = Path(storage_path)
+    def __init__(self, storage_path: Optional[str] = "data/mirror_store.json"):
+        self.storage_path = Path(storage_path) if storage_path else None
         self.mirrors: dict[str, dict] = {
             "lab": {"records": {}, "last_sync": None},
             "auditor": {"records": {}, "last_sync": None},
@@ -34,7 +35,7 @@ class MirrorSimulation:
 
     def _load(self) -> None:
         """Load mirror data from storage."""
-        if self.storage_path.exists():
+        if self.storage_path and self.storage_path.exists():
             try:
                 with open(self.storage_path, 'r') as f:
                     content = f.read()
@@ -51,6 +52,8 @@ class MirrorSimulation:
 
     def _save(self) -> None:
         """Save mirror data to storage."""
+        if not self.storage_path:
+            return
         self.storage_path.parent.mkdir(parents=True, exist_ok=True)
         data = {}
         for party in self.PARTIES:
@@ -1,10 +1,39 @@
 """Pydantic models for AI Flight Recorder."""
 
+import math
 from datetime import datetime
 from enum import Enum
-from typing import Any, Optional
+from typing import Annotated, Any, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import AfterValidator, BaseModel, Field, StringConstraints
+
+# Shared string constraints, compiled into each model's schema once at class creation
+Title = Annotated[str, StringConstraints(min_length=5, max_length=200)]
+
+
+def _check_storable(value: Any) -> Any:
+    """Reject JSON values the ledger store cannot round-trip exactly."""
+    if isinstance(value, dict):
+        for key, item in value.items():
+            if not isinstance(key, str):
+                raise ValueError("metadata keys must be strings")
+            _check_storable(item)
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            _check_storable(item)
+    elif isinstance(value, bool):
+        pass
+    elif isinstance(value, int):
+        if not -2**63 <= value < 2**64:
+            raise ValueError("metadata integers must fit in 64 bits")
+    elif isinstance(value, float):
+        if not math.isfinite(value):
+            raise ValueError("metadata numbers must be finite")
+    return value
+
+
+# Free-form metadata persisted in the ledger, limited to values the store encodes losslessly
+StoredMetadata = Annotated[dict[str, Any], AfterValidator(_check_storable)]
 
 
 class EventType(str, Enum):
@@ -99,6 +128,7 @@ class ZKCommitment(BaseModel):
     timestamp: datetime
 
     class Config:
+        frozen = True
         json_encoders = {
             datetime: lambda v: v.isoformat()
         }
@@ -128,6 +158,7 @@ class ZKProof(BaseModel):
     timestamp: datetime
 
     class Config:
+        frozen = True
         json_encoders = {
             datetime: lambda v: v.isoformat()
         }
@@ -184,7 +215,7 @@ class ConcernCreate(BaseModel):
     """Request to create a new concern."""
 
     category: ConcernCategory
-    title: str = Field(..., min_length=5, max_length=200)
+    title: Title
     description: str = Field(..., min_length=10, max_length=5000)
     evidence_hash: Optional[str] = None  # Hash of supporting evidence
     deployment_id: Optional[str] = None  # Link to specific deployment
@@ -208,6 +239,7 @@ class Concern(BaseModel):
     hash: str  # For tamper-proof chain
 
     class Config:
+        frozen = True
         json_encoders = {
             datetime: lambda v: v.isoformat()
         }
@@ -316,10 +348,10 @@ class ComplianceSubmissionCreate(BaseModel):
     template_type: ComplianceTemplateType
     deployment_id: str = Field(..., min_length=1)
     model_id: str = Field(..., min_length=1)
-    title: str = Field(..., min_length=5, max_length=200)
+    title: Title
     summary: str = Field(..., min_length=10, max_length=2000)
     evidence_hash: str = Field(..., min_length=64, max_length=64)  # Required SHA-256 hash
-    metadata: dict[str, Any] = Field(default_factory=dict)  # Template-specific fields
+    metadata: StoredMetadata = Field(default_factory=dict)  # Template-specific fields
 
 
 class ComplianceSubmission(BaseModel):
@@ -342,6 +374,7 @@ class ComplianceSubmission(BaseModel):
     hash: str  # For tamper-proof chain
 
     class Config:
+        frozen = True
         json_encoders = {
             datetime: lambda v: v.isoformat()
         }
@@ -357,15 +390,19 @@ class ComplianceReviewCreate(BaseModel):
 
 
 class DeploymentComplianceStatus(BaseModel):
-    """Full compliance status for a deployment."""
+    """Full compliance status for a deployment.
+
+    Immutable, including the template sequences, because the ledger hands
+    the same memoized instance to every caller until its next mutation.
+    """
 
     deployment_id: str
     model_id: str
-    required_templates: list[ComplianceTemplateType]
-    submitted_templates: list[ComplianceTemplateType]
-    verified_templates: list[ComplianceTemplateType]
-    missing_templates: list[ComplianceTemplateType]
-    rejected_templates: list[ComplianceTemplateType]
+    required_templates: tuple[ComplianceTemplateType, ...]
+    submitted_templates: tuple[ComplianceTemplateType, ...]
+    verified_templates: tuple[ComplianceTemplateType, ...]
+    missing_templates: tuple[ComplianceTemplateType, ...]
+    rejected_templates: tuple[ComplianceTemplateType, ...]
 
     # Concern status (from existing system)
     open_concerns: int
@@ -378,6 +415,9 @@ class DeploymentComplianceStatus(BaseModel):
     is_cleared: bool  # Both compliance complete AND concerns resolved
     message: str
 
+    class Config:
+        frozen = True
+
 
 # === Role Authentication Models ===
 
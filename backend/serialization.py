@@ -0,0 +1,52 @@
+"""JSON encoding for the on-disk stores, using orjson when it is installed."""
+
+import json
+import mmap
+import os
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None
+
+# orjson.JSONDecodeError subclasses this, so one except clause covers both backends
+JSONDecodeError = json.JSONDecodeError
+
+
+def _default(obj: Any) -> Any:
+    """Encode enums by value and anything else (e.g. datetimes) as a string."""
+    value = getattr(obj, "value", None)
+    return value if value is not None else str(obj)
+
+
+def dumps(obj: Any, indent: bool = False) -> bytes:
+    """Serialize obj to UTF-8 JSON bytes, pretty-printed with two spaces if indent."""
+    if orjson is not None:
+        return orjson.dumps(obj, default=_default, option=orjson.OPT_INDENT_2 if indent else 0)
+    if indent:
+        return json.dumps(obj, default=_default, indent=2).encode('utf-8')
+    return json.dumps(obj, default=_default, separators=(',', ':')).encode('utf-8')
+
+
+def loads(data: Union[bytes, memoryview, str]) -> Any:
+    """Parse JSON from bytes, a byte buffer view, or str."""
+    if orjson is not None:
+        return orjson.loads(data)
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    return json.loads(data)
+
+
+def load_file(path: Union[str, os.PathLike]) -> Any:
+    """
+    Parse a JSON file, reading it through a memory map rather than a copy.
+
+    Returns None for an empty file; malformed content raises JSONDecodeError.
+    """
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return None
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            with memoryview(mm) as view:
+                return loads(view)
@@ -1,12 +1,16 @@
 """Shared Transparency Ledger for Whistleblower-Aware Governance."""
 
-import json
+import hashlib
+import os
 import secrets
+from collections import Counter, OrderedDict, defaultdict
 from datetime import datetime
+from operator import itemgetter
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 
-from .crypto_utils import generate_anonymous_id, hash_data
+from . import serialization
+from .crypto_utils import combine_hashes, generate_anonymous_id, hash_data
 from .models import (
     ComplianceReviewCreate,
     ComplianceStatus,
@@ -26,6 +30,37 @@ from .models import (
     SubmitterRole,
 )
 
+# Concern fields hashed in canonical order (see _compute_concern_hash)
+CONCERN_HASH_FIELDS = (
+    "id",
+    "category",
+    "title",
+    "description",
+    "submitter_id",
+    "submitter_role",
+    "status",
+    "evidence_hash",
+    "deployment_id",
+    "model_id",
+    "timestamp",
+)
+
+# Enum values hashed into concern records, encoded once at import
+_ENUM_VALUE_BYTES = {
+    member.value: member.value.encode('utf-8')
+    for enum in (ConcernCategory, ConcernStatus, SubmitterRole)
+    for member in enum
+}
+
+# Length prefix marking an absent field in concern hashes
+_NONE_FIELD = b"\xff" * 8
+
+# Log entries appended before the snapshot is rewritten and the log truncated
+COMPACT_THRESHOLD = int(os.environ.get("LEDGER_COMPACT_THRESHOLD", "1000"))
+
+# Maximum number of memoized deployment gate results
+GATE_CACHE_SIZE = 1024
+
 # Default required templates for deployment clearance
 DEFAULT_REQUIRED_TEMPLATES = [
     ComplianceTemplateType.SAFETY_EVALUATION,
@@ -44,42 +79,264 @@ class TransparencyLedger:
     - Whistleblower identities protected via anonymous IDs
     - Tamper-proof through hash chain
     - Deployment blocked until all concerns resolved
+
+    Pass storage_path=None to keep the ledger in memory only. Changed
+    records are appended to an append-only log next to the snapshot
+    (storage_path + ".log") as soon as each mutation returns. Callers that
+    can tolerate losing unflushed work may pass batch_size > 1 to append
+    in batches instead; pending records are also written on flush() or
+    when the ledger is used as a context manager and exits. With
+    auto_persist=False they are only written on flush(). Once the log
+    holds COMPACT_THRESHOLD entries it is folded into the snapshot.
     """
 
-    def __init__(self, storage_path: str = "data/transparency_ledger.json"):
-        self.storage_path = Path(storage_path)
+    def __init__(
+        self,
+        storage_path: Optional[str] = "data/transparency_ledger.json",
+        auto_persist: bool = True,
+        batch_size: int = 1
+    ):
+        self.storage_path = Path(storage_path) if storage_path else None
+        self.log_path = (
+            self.storage_path.with_name(self.storage_path.name + ".log")
+            if self.storage_path else None
+        )
+        self.auto_persist = auto_persist
+        self.batch_size = batch_size
         self.concerns: dict[str, dict] = {}
         self.responses: dict[str, dict] = {}
         self.resolutions: dict[str, dict] = {}
         self.compliance_submissions: dict[str, dict] = {}
+        # Secondary concern indexes: status / category value or deployment id -> concern ids
+        self._by_status: dict[str, set[str]] = defaultdict(set)
+        self._by_category: dict[str, set[str]] = defaultdict(set)
+        self._by_deployment: dict[str, set[str]] = defaultdict(set)
+        self._status_counts: Counter[str] = Counter()
+        # Compliance submission indexes: deployment / (deployment, model) / template -> ids
+        self._sub_by_deployment: dict[str, set[str]] = defaultdict(set)
+        self._sub_by_dep_model: dict[tuple[str, str], set[str]] = defaultdict(set)
+        self._sub_by_template: dict[str, set[str]] = defaultdict(set)
+        # Deployment gate memo: key -> (mutation version, status)
+        self._mutation_version = 0
+        self._gate_cache: OrderedDict[tuple, tuple[int, DeploymentComplianceStatus]] = OrderedDict()
+        # Merkle frontier over concern hashes: level -> pending subtree root
+        self._frontier: list[Optional[str]] = []
+        self._dirty = False
+        self._pending_writes = 0
+        # Records awaiting a log append: (collection, record id) -> record
+        self._pending: dict[tuple[str, str], dict] = {}
+        self._log_entries = 0
         self._load()
+        self._rebuild_indexes()
+
+    def _collections(self) -> dict[str, dict[str, dict]]:
+        """Map each persisted collection name to its records."""
+        return {
+            "concerns": self.concerns,
+            "responses": self.responses,
+            "resolutions": self.resolutions,
+            "compliance_submissions": self.compliance_submissions
+        }
 
     def _load(self) -> None:
-        """Load ledger from storage."""
+        """Load the ledger snapshot, then replay the append-only log over it."""
+        if not self.storage_path:
+            return
         if self.storage_path.exists():
             try:
-                with open(self.storage_path, 'r') as f:
-                    content = f.read().strip()
-                    if content:
-                        data = json.loads(content)
-                        self.concerns = data.get("concerns", {})
-                        self.responses = data.get("responses", {})
-                        self.resolutions = data.get("resolutions", {})
-                        self.compliance_submissions = data.get("compliance_submissions", {})
-            except (json.JSONDecodeError, IOError):
+                data = serialization.load_file(self.storage_path)
+                if data:
+                    self.concerns = data.get("concerns", {})
+                    self.responses = data.get("responses", {})
+                    self.resolutions = data.get("resolutions", {})
+                    self.compliance_submissions = data.get("compliance_submissions", {})
+            except (serialization.JSONDecodeError, IOError):
                 # If file is empty or corrupted, start fresh
                 pass
+        if self.log_path.exists():
+            collections = self._collections()
+            torn = False
+            with open(self.log_path, 'rb') as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    try:
+                        entry = serialization.loads(line)
+                    except serialization.JSONDecodeError:
+                        # Torn append; skip it and keep every intact entry
+                        torn = True
+                        continue
+                    record = entry["record"]
+                    collections[entry["collection"]][record["id"]] = record
+                    self._log_entries += 1
+            if torn:
+                # Later appends would glue onto the unterminated fragment
+                self.compact()
 
     def _save(self) -> None:
-        """Persist ledger to storage."""
+        """Write a full snapshot of the ledger to storage."""
+        if not self.storage_path:
+            return
         self.storage_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(self.storage_path, 'w') as f:
-            json.dump({
-                "concerns": self.concerns,
-                "responses": self.responses,
-                "resolutions": self.resolutions,
-                "compliance_submissions": self.compliance_submissions
-            }, f, indent=2, default=str)
+        tmp_path = self.storage_path.with_name(self.storage_path.name + ".tmp")
+        with open(tmp_path, 'wb') as f:
+            f.write(serialization.dumps(self._collections(), indent=True))
+        os.replace(tmp_path, self.storage_path)
+
+    def _append_log(self) -> None:
+        """Append pending records to the log in a single write."""
+        if not self.log_path or not self._pending:
+            return
+        self.log_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.log_path, 'ab') as f:
+            f.write(b"".join(
+                serialization.dumps(
+                    {"op": "put", "collection": collection, "record": record}
+                ) + b"\n"
+                for (collection, _), record in self._pending.items()
+            ))
+        self._log_entries += len(self._pending)
+
+    def _rebuild_indexes(self) -> None:
+        """Rebuild secondary concern and compliance indexes from the loaded records."""
+        self._by_status = defaultdict(set)
+        self._by_category = defaultdict(set)
+        self._by_deployment = defaultdict(set)
+        self._status_counts = Counter()
+        for data in self.concerns.values():
+            self._index_concern(data)
+        self._frontier = self._build_frontier(
+            [data["hash"] for data in self.concerns.values()]
+        )
+        self._sub_by_deployment = defaultdict(set)
+        self._sub_by_dep_model = defaultdict(set)
+        self._sub_by_template = defaultdict(set)
+        for data in self.compliance_submissions.values():
+            self._index_submission(data)
+
+    def _index_concern(self, data: dict) -> None:
+        """Add a concern record to the secondary indexes."""
+        self._by_status[data["status"]].add(data["id"])
+        self._status_counts[data["status"]] += 1
+        self._by_category[data["category"]].add(data["id"])
+        if data.get("deployment_id"):
+            self._by_deployment[data["deployment_id"]].add(data["id"])
+
+    def _index_submission(self, data: dict) -> None:
+        """Add a compliance submission record to the secondary indexes."""
+        self._sub_by_deployment[data["deployment_id"]].add(data["id"])
+        self._sub_by_dep_model[(data["deployment_id"], data["model_id"])].add(data["id"])
+        self._sub_by_template[data["template_type"]].add(data["id"])
+
+    @staticmethod
+    def _build_frontier(leaves: list[str]) -> list[Optional[str]]:
+        """
+        Build the Merkle frontier for a batch of leaves level by level.
+
+        Equivalent to appending each leaf in turn, but pairs a whole level
+        per pass instead of walking the frontier once per leaf.
+
+        Args:
+            leaves: Concern hashes in insertion order
+
+        Returns:
+            Frontier with one pending subtree root (or None) per level
+        """
+        frontier: list[Optional[str]] = []
+        level = leaves
+        while level:
+            frontier.append(level[-1] if len(level) % 2 else None)
+            level = [combine_hashes(l, r) for l, r in zip(level[::2], level[1::2])]
+        return frontier
+
+    def _append_leaf(self, leaf_hash: str) -> None:
+        """Fold a new concern hash into the Merkle frontier in O(log n)."""
+        node = leaf_hash
+        level = 0
+        while level < len(self._frontier) and self._frontier[level] is not None:
+            node = combine_hashes(self._frontier[level], node)
+            self._frontier[level] = None
+            level += 1
+        if level == len(self._frontier):
+            self._frontier.append(node)
+        else:
+            self._frontier[level] = node
+
+    def root_hash(self) -> Optional[str]:
+        """
+        Get the Merkle root committing to every concern in insertion order.
+
+        Matches MerkleTree over the concern hashes, including its rule of
+        pairing a level's odd last node with itself, so inclusion proofs
+        from MerkleTree.get_proof verify against it.
+
+        Returns:
+            Root hash, or None if the ledger has no concerns
+        """
+        top = len(self._frontier) - 1
+        # Root of the leaves to the right of every complete subtree seen so far
+        carry = None
+        for level, node in enumerate(self._frontier):
+            if node is not None and carry is not None:
+                carry = combine_hashes(node, carry)
+            elif node is not None:
+                if level == top:
+                    return node
+                carry = combine_hashes(node, node)
+            elif carry is not None:
+                carry = combine_hashes(carry, carry)
+        return carry
+
+    def _set_concern_status(self, concern_id: str, status: ConcernStatus) -> None:
+        """Update a concern's status and keep the status index in sync."""
+        data = self.concerns[concern_id]
+        self._by_status[data["status"]].discard(concern_id)
+        self._status_counts[data["status"]] -= 1
+        data["status"] = status.value
+        self._by_status[status.value].add(concern_id)
+        self._status_counts[status.value] += 1
+
+    def _mark_dirty(self, *changes: tuple[str, dict]) -> None:
+        """
+        Record a mutation, flushing once batch_size mutations are pending.
+
+        Args:
+            changes: (collection, record) pairs touched by the mutation
+        """
+        # Every mutation ends here, so this also invalidates memoized gate results
+        self._mutation_version += 1
+        for collection, record in changes:
+            self._pending[(collection, record["id"])] = record
+        self._dirty = True
+        self._pending_writes += 1
+        if self.auto_persist and self._pending_writes >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Append pending records to the log, compacting once it is long enough."""
+        if self._dirty:
+            self._append_log()
+            self._pending = {}
+            self._dirty = False
+            self._pending_writes = 0
+            if self._log_entries >= COMPACT_THRESHOLD:
+                self.compact()
+
+    def compact(self) -> None:
+        """Fold the log into a fresh snapshot and truncate it."""
+        self._save()
+        if self.log_path and self.log_path.exists():
+            self.log_path.unlink()
+        self._pending = {}
+        self._dirty = False
+        self._pending_writes = 0
+        self._log_entries = 0
+
+    def __enter__(self) -> "TransparencyLedger":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.flush()
 
     def _generate_id(self) -> str:
         """Generate a unique ID for entries."""
@@ -89,6 +346,27 @@ class TransparencyLedger:
         """Compute hash for tamper-proofing."""
         return hash_data(data)
 
+    @staticmethod
+    def _compute_concern_hash(concern_data: dict) -> str:
+        """
+        Hash a concern's fields directly, without a JSON serialization pass.
+
+        Fields are fed to SHA-256 in CONCERN_HASH_FIELDS order, each prefixed
+        with its 8-byte big-endian length so user text cannot shift bytes
+        between fields. A missing value is written as the all-ones length,
+        which no real value can have, so None and "" hash differently.
+        """
+        h = hashlib.sha256()
+        for field in CONCERN_HASH_FIELDS:
+            value = concern_data.get(field)
+            if value is None:
+                h.update(_NONE_FIELD)
+                continue
+            encoded = _ENUM_VALUE_BYTES.get(value) or value.encode('utf-8')
+            h.update(len(encoded).to_bytes(8, "big"))
+            h.update(encoded)
+        return h.hexdigest()
+
     # === Concern Management ===
 
     def raise_concern(
@@ -108,6 +386,37 @@ class TransparencyLedger:
         Returns:
             The created concern record
         """
+        created = self._insert_concern(concern, submitter_id, submitter_role)
+        self._mark_dirty(("concerns", self.concerns[created.id]))
+        return created
+
+    def raise_concerns_bulk(
+        self,
+        items: list[tuple[ConcernCreate, str, SubmitterRole]]
+    ) -> list[Concern]:
+        """
+        Raise several concerns, recording them as a single pending write.
+
+        Args:
+            items: (concern, submitter_id, submitter_role) tuples
+
+        Returns:
+            The created concern records, in input order
+        """
+        created = [
+            self._insert_concern(concern, submitter_id, submitter_role)
+            for concern, submitter_id, submitter_role in items
+        ]
+        self._mark_dirty(*(("concerns", self.concerns[c.id]) for c in created))
+        return created
+
+    def _insert_concern(
+        self,
+        concern: ConcernCreate,
+        submitter_id: str,
+        submitter_role: SubmitterRole
+    ) -> Concern:
+        """Add a concern record and update indexes, without persisting."""
         concern_id = self._generate_id()
         timestamp = datetime.utcnow()
 
@@ -125,9 +434,10 @@ class TransparencyLedger:
             "timestamp": timestamp.isoformat(),
         }
 
-        concern_data["hash"] = self._compute_hash(concern_data)
+        concern_data["hash"] = self._compute_concern_hash(concern_data)
         self.concerns[concern_id] = concern_data
-        self._save()
+        self._index_concern(concern_data)
+        self._append_leaf(concern_data["hash"])
 
         return Concern(
             id=concern_id,
@@ -172,16 +482,23 @@ class TransparencyLedger:
         category: Optional[ConcernCategory] = None
     ) -> list[Concern]:
         """List concerns with optional filters."""
-        results = []
-        for data in self.concerns.values():
-            # Apply filters
-            if deployment_id and data.get("deployment_id") != deployment_id:
-                continue
-            if status and data["status"] != status.value:
-                continue
-            if category and data["category"] != category.value:
-                continue
+        # Narrow candidates by intersecting the secondary indexes
+        filters = []
+        if deployment_id:
+            filters.append(self._by_deployment.get(deployment_id, set()))
+        if status:
+            filters.append(self._by_status.get(status.value, set()))
+        if category:
+            filters.append(self._by_category.get(category.value, set()))
+
+        if filters:
+            filters.sort(key=len)
+            candidates = [self.concerns[cid] for cid in filters[0].intersection(*filters[1:])]
+        else:
+            candidates = self.concerns.values()
 
+        results = []
+        for data in candidates:
             results.append(Concern(
                 id=data["id"],
                 category=ConcernCategory(data["category"]),
@@ -242,9 +559,9 @@ class TransparencyLedger:
         # Update concern status to ADDRESSED (unless already resolved)
         concern = self.concerns[response.concern_id]
         if concern["status"] != ConcernStatus.RESOLVED.value:
-            concern["status"] = ConcernStatus.ADDRESSED.value
+            self._set_concern_status(response.concern_id, ConcernStatus.ADDRESSED)
 
-        self._save()
+        self._mark_dirty(("responses", response_data), ("concerns", concern))
 
         return ConcernResponse(
             id=response_id,
@@ -267,8 +584,8 @@ class TransparencyLedger:
         if concern_id not in self.concerns:
             return False
 
-        self.concerns[concern_id]["status"] = ConcernStatus.DISPUTED.value
-        self._save()
+        self._set_concern_status(concern_id, ConcernStatus.DISPUTED)
+        self._mark_dirty(("concerns", self.concerns[concern_id]))
         return True
 
     def get_responses(self, concern_id: str) -> list[ConcernResponse]:
@@ -325,8 +642,11 @@ class TransparencyLedger:
         self.resolutions[resolution_id] = resolution_data
 
         # Update concern status to RESOLVED
-        self.concerns[resolution.concern_id]["status"] = ConcernStatus.RESOLVED.value
-        self._save()
+        self._set_concern_status(resolution.concern_id, ConcernStatus.RESOLVED)
+        self._mark_dirty(
+            ("resolutions", resolution_data),
+            ("concerns", self.concerns[resolution.concern_id])
+        )
 
         return Resolution(
             id=resolution_id,
@@ -354,6 +674,46 @@ class TransparencyLedger:
         Returns:
             The created compliance submission record
         """
+        submission_data = self._insert_submission(submission, lab_id)
+        self._mark_dirty(("compliance_submissions", submission_data))
+        return self._submission_from_record(submission_data)
+
+    def bulk_submit_compliance(
+        self,
+        items: list[tuple[ComplianceSubmissionCreate, Optional[ComplianceReviewCreate]]],
+        lab_id: str,
+        auditor_id: str
+    ) -> list[ComplianceSubmission]:
+        """
+        Submit several compliance documents, reviewing each as it is inserted,
+        and record them all as a single pending write.
+
+        Args:
+            items: (submission, review) pairs; review may be None to leave the
+                submission unreviewed. A review's submission_id is ignored and
+                it applies to the submission it is paired with.
+            lab_id: ID of the lab submitting
+            auditor_id: ID of the auditor reviewing
+
+        Returns:
+            The created submission records, in input order
+        """
+        for _, review in items:
+            if review is not None:
+                self._check_review_status(review)
+
+        records = []
+        for submission, review in items:
+            data = self._insert_submission(submission, lab_id)
+            if review is not None:
+                self._apply_review(data, review, auditor_id)
+            records.append(data)
+
+        self._mark_dirty(*(("compliance_submissions", data) for data in records))
+        return [self._submission_from_record(data) for data in records]
+
+    def _insert_submission(self, submission: ComplianceSubmissionCreate, lab_id: str) -> dict:
+        """Store and index a new submission record without marking the ledger dirty."""
         submission_id = self._generate_id()
         timestamp = datetime.utcnow()
 
@@ -376,29 +736,12 @@ class TransparencyLedger:
 
         submission_data["hash"] = self._compute_hash(submission_data)
         self.compliance_submissions[submission_id] = submission_data
-        self._save()
+        self._index_submission(submission_data)
+        return submission_data
 
-        return ComplianceSubmission(
-            id=submission_id,
-            template_type=submission.template_type,
-            deployment_id=submission.deployment_id,
-            model_id=submission.model_id,
-            lab_id=lab_id,
-            title=submission.title,
-            summary=submission.summary,
-            evidence_hash=submission.evidence_hash,
-            metadata=submission.metadata,
-            status=ComplianceStatus.SUBMITTED,
-            submitted_at=timestamp,
-            hash=submission_data["hash"]
-        )
-
-    def get_compliance_submission(self, submission_id: str) -> Optional[ComplianceSubmission]:
-        """Get a specific compliance submission by ID."""
-        if submission_id not in self.compliance_submissions:
-            return None
-
-        data = self.compliance_submissions[submission_id]
+    @staticmethod
+    def _submission_from_record(data: dict) -> ComplianceSubmission:
+        """Build a ComplianceSubmission model from a stored record."""
         return ComplianceSubmission(
             id=data["id"],
             template_type=ComplianceTemplateType(data["template_type"]),
@@ -417,6 +760,61 @@ class TransparencyLedger:
             hash=data["hash"]
         )
 
+    def get_compliance_submission(self, submission_id: str) -> Optional[ComplianceSubmission]:
+        """Get a specific compliance submission by ID."""
+        data = self.compliance_submissions.get(submission_id)
+        if data is None:
+            return None
+        return self._submission_from_record(data)
+
+    def _iter_compliance_submissions(
+        self,
+        deployment_id: Optional[str] = None,
+        lab_id: Optional[str] = None,
+        template_type: Optional[ComplianceTemplateType] = None,
+        status: Optional[ComplianceStatus] = None
+    ) -> Iterator[dict]:
+        """
+        Yield stored submission records matching every given filter.
+
+        The scan is driven by the smallest applicable index; the filters it
+        does not already guarantee are compiled into one itemgetter
+        comparison, so each record costs a single tuple compare.
+        """
+        filters = {
+            "deployment_id": deployment_id,
+            "template_type": template_type.value if template_type else None,
+            "lab_id": lab_id,
+            "status": status.value if status else None,
+        }
+        filters = {field: value for field, value in filters.items() if value}
+
+        indexed = []
+        if "deployment_id" in filters:
+            indexed.append(("deployment_id", self._sub_by_deployment.get(deployment_id, set())))
+        if "template_type" in filters:
+            indexed.append(("template_type", self._sub_by_template.get(filters["template_type"], set())))
+
+        if indexed:
+            field, ids = min(indexed, key=lambda entry: len(entry[1]))
+            del filters[field]
+            candidates = (self.compliance_submissions[sid] for sid in ids)
+        else:
+            candidates = self.compliance_submissions.values()
+
+        if not filters:
+            yield from candidates
+            return
+
+        fields = tuple(filters)
+        expected = tuple(filters.values())
+        get = itemgetter(*fields)
+        if len(fields) == 1:
+            expected = expected[0]
+        for data in candidates:
+            if get(data) == expected:
+                yield data
+
     def list_compliance_submissions(
         self,
         deployment_id: Optional[str] = None,
@@ -425,35 +823,12 @@ class TransparencyLedger:
         status: Optional[ComplianceStatus] = None
     ) -> list[ComplianceSubmission]:
         """List compliance submissions with optional filters."""
-        results = []
-        for data in self.compliance_submissions.values():
-            # Apply filters
-            if deployment_id and data["deployment_id"] != deployment_id:
-                continue
-            if lab_id and data["lab_id"] != lab_id:
-                continue
-            if template_type and data["template_type"] != template_type.value:
-                continue
-            if status and data["status"] != status.value:
-                continue
-
-            results.append(ComplianceSubmission(
-                id=data["id"],
-                template_type=ComplianceTemplateType(data["template_type"]),
-                deployment_id=data["deployment_id"],
-                model_id=data["model_id"],
-                lab_id=data["lab_id"],
-                title=data["title"],
-                summary=data["summary"],
-                evidence_hash=data["evidence_hash"],
-                metadata=data.get("metadata", {}),
-                status=ComplianceStatus(data["status"]),
-                submitted_at=datetime.fromisoformat(data["submitted_at"]),
-                reviewed_at=datetime.fromisoformat(data["reviewed_at"]) if data.get("reviewed_at") else None,
-                reviewed_by=data.get("reviewed_by"),
-                review_notes=data.get("review_notes"),
-                hash=data["hash"]
-            ))
+        results = [
+            self._submission_from_record(data)
+            for data in self._iter_compliance_submissions(
+                deployment_id, lab_id, template_type, status
+            )
+        ]
 
         # Sort by submission time (newest first)
         results.sort(key=lambda s: s.submitted_at, reverse=True)
@@ -477,10 +852,22 @@ class TransparencyLedger:
         if review.submission_id not in self.compliance_submissions:
             return None
 
+        self._check_review_status(review)
+
+        data = self.compliance_submissions[review.submission_id]
+        self._apply_review(data, review, auditor_id)
+        self._mark_dirty(("compliance_submissions", data))
+
+        return self._submission_from_record(data)
+
+    @staticmethod
+    def _check_review_status(review: ComplianceReviewCreate) -> None:
+        """Reject reviews that neither verify nor reject a submission."""
         if review.status not in [ComplianceStatus.VERIFIED, ComplianceStatus.REJECTED]:
             raise ValueError("Review status must be VERIFIED or REJECTED")
 
-        data = self.compliance_submissions[review.submission_id]
+    def _apply_review(self, data: dict, review: ComplianceReviewCreate, auditor_id: str) -> None:
+        """Record a review on a stored submission and recompute its hash."""
         timestamp = datetime.utcnow()
 
         data["status"] = review.status.value
@@ -491,12 +878,14 @@ class TransparencyLedger:
 
         # Recompute hash
         data["hash"] = self._compute_hash(data)
-        self._save()
-
-        return self.get_compliance_submission(review.submission_id)
 
     # === Deployment Clearance ===
 
+    def _deployment_status_counts(self, deployment_id: str) -> Counter[str]:
+        """Count a deployment's concerns by status value in a single pass."""
+        concern_ids = self._by_deployment.get(deployment_id, set())
+        return Counter(self.concerns[cid]["status"] for cid in concern_ids)
+
     def check_deployment_clearance(self, deployment_id: str) -> DeploymentClearance:
         """
         Check if a deployment is cleared (all concerns resolved).
@@ -507,12 +896,12 @@ class TransparencyLedger:
         Returns:
             Clearance status with concern breakdown
         """
-        concerns = self.list_concerns(deployment_id=deployment_id)
+        counts = self._deployment_status_counts(deployment_id)
 
-        open_count = sum(1 for c in concerns if c.status == ConcernStatus.OPEN)
-        addressed_count = sum(1 for c in concerns if c.status == ConcernStatus.ADDRESSED)
-        disputed_count = sum(1 for c in concerns if c.status == ConcernStatus.DISPUTED)
-        resolved_count = sum(1 for c in concerns if c.status == ConcernStatus.RESOLVED)
+        open_count = counts[ConcernStatus.OPEN.value]
+        addressed_count = counts[ConcernStatus.ADDRESSED.value]
+        disputed_count = counts[ConcernStatus.DISPUTED.value]
+        resolved_count = counts[ConcernStatus.RESOLVED.value]
 
         unresolved = open_count + addressed_count + disputed_count
         is_cleared = unresolved == 0
@@ -524,7 +913,7 @@ class TransparencyLedger:
 
         return DeploymentClearance(
             deployment_id=deployment_id,
-            total_concerns=len(concerns),
+            total_concerns=sum(counts.values()),
             open_concerns=open_count,
             addressed_concerns=addressed_count + disputed_count,
             resolved_concerns=resolved_count,
@@ -542,6 +931,8 @@ class TransparencyLedger:
         Get full compliance status for a deployment - checks BOTH compliance submissions
         AND concerns. This is the unified deployment gate.
 
+        Results are memoized until the next ledger mutation.
+
         Args:
             deployment_id: The deployment to check
             model_id: The model being deployed
@@ -553,29 +944,106 @@ class TransparencyLedger:
         if required_templates is None:
             required_templates = DEFAULT_REQUIRED_TEMPLATES
 
-        # Get compliance submissions for this deployment
-        submissions = self.list_compliance_submissions(deployment_id=deployment_id)
+        key = (deployment_id, model_id, tuple(required_templates))
+        cached = self._gate_cache.get(key)
+        if cached is not None and cached[0] == self._mutation_version:
+            self._gate_cache.move_to_end(key)
+            return cached[1]
+
+        status = self._compute_deployment_compliance_status(
+            deployment_id, model_id, required_templates
+        )
+        self._gate_cache[key] = (self._mutation_version, status)
+        self._gate_cache.move_to_end(key)
+        if len(self._gate_cache) > GATE_CACHE_SIZE:
+            self._gate_cache.popitem(last=False)
+        return status
+
+    def is_deployment_cleared(
+        self,
+        deployment_id: str,
+        model_id: str,
+        required_templates: Optional[list[ComplianceTemplateType]] = None
+    ) -> bool:
+        """
+        Answer the deployment gate as a boolean, stopping at the first failing check.
+
+        Agrees with get_deployment_compliance_status(...).is_cleared without
+        building the full status report.
+
+        Args:
+            deployment_id: The deployment to check
+            model_id: The model being deployed
+            required_templates: Templates required for clearance (defaults to standard set)
+
+        Returns:
+            True if every required template is verified, none is rejected,
+            and every concern on the deployment is resolved
+        """
+        if required_templates is None:
+            required_templates = DEFAULT_REQUIRED_TEMPLATES
+
+        resolved = ConcernStatus.RESOLVED.value
+        concerns = self.concerns
+        for cid in self._by_deployment.get(deployment_id, ()):
+            if concerns[cid]["status"] != resolved:
+                return False
+
+        verified = ComplianceStatus.VERIFIED.value
+        rejected = ComplianceStatus.REJECTED.value
+        verified_values: set[str] = set()
+        submissions = self.compliance_submissions
+        for sid in self._sub_by_dep_model.get((deployment_id, model_id), ()):
+            data = submissions[sid]
+            if data["status"] == rejected:
+                return False
+            if data["status"] == verified:
+                verified_values.add(data["template_type"])
+
+        return all(t.value in verified_values for t in required_templates)
+
+    def _compute_deployment_compliance_status(
+        self,
+        deployment_id: str,
+        model_id: str,
+        required_templates: list[ComplianceTemplateType]
+    ) -> DeploymentComplianceStatus:
+        """Compute the deployment gate, bypassing the memo."""
+
+        # Get compliance submissions for this deployment and model
+        submission_ids = self._sub_by_dep_model.get((deployment_id, model_id), set())
+
+        # Single pass over the raw records, grouping template values by status
+        submitted_values: set[str] = set()
+        verified_values: set[str] = set()
+        rejected_values: set[str] = set()
+        by_status = {
+            ComplianceStatus.VERIFIED.value: verified_values,
+            ComplianceStatus.REJECTED.value: rejected_values,
+        }
+        submissions = self.compliance_submissions
 
-        submitted_templates = []
-        verified_templates = []
-        rejected_templates = []
+        for sid in submission_ids:
+            data = submissions[sid]
+            template_value = data["template_type"]
+            submitted_values.add(template_value)
+            group = by_status.get(data["status"])
+            if group is not None:
+                group.add(template_value)
 
-        for sub in submissions:
-            submitted_templates.append(sub.template_type)
-            if sub.status == ComplianceStatus.VERIFIED:
-                verified_templates.append(sub.template_type)
-            elif sub.status == ComplianceStatus.REJECTED:
-                rejected_templates.append(sub.template_type)
+        submitted_templates = [ComplianceTemplateType(v) for v in submitted_values]
+        verified_templates = [ComplianceTemplateType(v) for v in verified_values]
+        rejected_templates = [ComplianceTemplateType(v) for v in rejected_values]
 
-        # Find missing templates
-        missing_templates = [t for t in required_templates if t not in verified_templates]
+        # Find missing templates, keeping the required order for the message
+        missing_templates = [t for t in required_templates if t.value not in verified_values]
 
         # Get concern status
-        concerns = self.list_concerns(deployment_id=deployment_id)
-        open_count = sum(1 for c in concerns if c.status == ConcernStatus.OPEN)
-        addressed_count = sum(1 for c in concerns if c.status == ConcernStatus.ADDRESSED)
-        disputed_count = sum(1 for c in concerns if c.status == ConcernStatus.DISPUTED)
-        resolved_count = sum(1 for c in concerns if c.status == ConcernStatus.RESOLVED)
+        counts = self._deployment_status_counts(deployment_id)
+        open_count = counts[ConcernStatus.OPEN.value]
+        addressed_count = counts[ConcernStatus.ADDRESSED.value]
+        disputed_count = counts[ConcernStatus.DISPUTED.value]
+        resolved_count = counts[ConcernStatus.RESOLVED.value]
         unresolved_concerns = open_count + addressed_count + disputed_count
 
         # Compute clearance
@@ -602,10 +1070,10 @@ class TransparencyLedger:
             deployment_id=deployment_id,
             model_id=model_id,
             required_templates=required_templates,
-            submitted_templates=list(set(submitted_templates)),
-            verified_templates=list(set(verified_templates)),
+            submitted_templates=submitted_templates,
+            verified_templates=verified_templates,
             missing_templates=missing_templates,
-            rejected_templates=list(set(rejected_templates)),
+            rejected_templates=rejected_templates,
             open_concerns=open_count,
             unresolved_concerns=unresolved_concerns,
             resolved_concerns=resolved_count,
@@ -625,10 +1093,10 @@ class TransparencyLedger:
         return {
             "total_concerns": len(all_concerns),
             "concerns_by_status": {
-                "open": sum(1 for c in all_concerns if c["status"] == ConcernStatus.OPEN.value),
-                "addressed": sum(1 for c in all_concerns if c["status"] == ConcernStatus.ADDRESSED.value),
-                "disputed": sum(1 for c in all_concerns if c["status"] == ConcernStatus.DISPUTED.value),
-                "resolved": sum(1 for c in all_concerns if c["status"] == ConcernStatus.RESOLVED.value),
+                "open": self._status_counts[ConcernStatus.OPEN.value],
+                "addressed": self._status_counts[ConcernStatus.ADDRESSED.value],
+                "disputed": self._status_counts[ConcernStatus.DISPUTED.value],
+                "resolved": self._status_counts[ConcernStatus.RESOLVED.value],
             },
             "concerns_by_role": {
                 "lab": sum(1 for c in all_concerns if c["submitter_role"] == SubmitterRole.LAB.value),
@@ -648,6 +1116,7 @@ class TransparencyLedger:
                 t.value: sum(1 for s in all_submissions if s["template_type"] == t.value)
                 for t in ComplianceTemplateType
             },
+            "merkle_root": self.root_hash(),
         }
 
     def reset(self) -> None:
@@ -656,4 +1125,7 @@ class TransparencyLedger:
         self.responses = {}
         self.resolutions = {}
         self.compliance_submissions = {}
-        self._save()
+        self._rebuild_indexes()
+        self._mutation_version += 1
+        self._gate_cache.clear()
+        self.compact()
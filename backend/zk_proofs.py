@@ -1,21 +1,29 @@
 """Zero-Knowledge Proof module for proving event counts without revealing exact values.
 
 This implements a hash-based commitment scheme:
-- Commitment: C = SHA256(count || random_blinding_factor)
+- Commitment: C = SHA256(count || blinding_factor || event_type)
 - Proof: Reveal that count - threshold >= 0 without revealing actual count
 - Verification: Third party confirms proof without learning the count
 """
 
+import base64
 import hashlib
-import json
 import os
 import secrets
+from collections import OrderedDict
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Optional
 
+from backend import serialization
 from backend.models import EventType, ZKCommitment, ZKProof
 
+# Log entries appended before the snapshot is rewritten and the log truncated
+COMPACT_THRESHOLD = int(os.environ.get("ZK_COMPACT_THRESHOLD", "1000"))
+
+# Maximum number of remembered successful proof verifications
+VERIFY_CACHE_SIZE = 4096
+
 
 class ZKCommitmentStore:
     """
@@ -23,8 +31,18 @@ class ZKCommitmentStore:
 
     This enables proving "at least N safety evaluations were run"
     without revealing the exact count.
+
+    New commitments are appended to a log next to the snapshot
+    (storage_path + ".log"), which is folded into the snapshot once it
+    holds COMPACT_THRESHOLD entries.
     """
 
+    # Event type values pre-encoded for commitment hashing
+    _ET_BYTES: dict[EventType, bytes] = {et: et.value.encode('utf-8') for et in EventType}
+
+    # Successfully verified proofs, shared by all stores: proof fields -> None
+    _verified_proofs: OrderedDict[tuple, None] = OrderedDict()
+
     def __init__(
         self,
         storage_path: str = "data/zk_store.json",
@@ -38,32 +56,91 @@ class ZKCommitmentStore:
             get_event_count: Callback to get current event count by type
         """
         self.storage_path = Path(storage_path)
+        self.log_path = self.storage_path.with_name(self.storage_path.name + ".log")
         self.get_event_count = get_event_count
         self.commitments: dict[str, dict[str, Any]] = {}
+        self._log_entries = 0
         self._load()
 
     def _load(self) -> None:
-        """Load commitments from storage file."""
+        """Load the commitment snapshot, then replay the append-only log over it."""
         if self.storage_path.exists():
             try:
-                with open(self.storage_path, 'r') as f:
-                    self.commitments = json.load(f)
-            except (json.JSONDecodeError, KeyError, ValueError):
+                self.commitments = {
+                    cid: self._from_json(stored)
+                    for cid, stored in (serialization.load_file(self.storage_path) or {}).items()
+                }
+            except (serialization.JSONDecodeError, KeyError, ValueError):
                 self.commitments = {}
+        if self.log_path.exists():
+            torn = False
+            with open(self.log_path, 'rb') as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    try:
+                        record = serialization.loads(line)["record"]
+                    except serialization.JSONDecodeError:
+                        # Torn append; skip it and keep every intact entry
+                        torn = True
+                        continue
+                    self.commitments[record["id"]] = self._from_json(record)
+                    self._log_entries += 1
+            if torn:
+                # Later appends would glue onto the unterminated fragment
+                self.compact()
 
     def _save(self) -> None:
-        """Persist commitments to storage file."""
+        """Write a full snapshot of the commitments to the storage file."""
+        self.storage_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.storage_path.with_name(self.storage_path.name + ".tmp")
+        with open(tmp_path, 'wb') as f:
+            f.write(serialization.dumps(
+                {cid: self._to_json(record) for cid, record in self.commitments.items()},
+                indent=True
+            ))
+        os.replace(tmp_path, self.storage_path)
+
+    def _append_log(self, record: dict[str, Any]) -> None:
+        """Append one commitment to the log, compacting once it is long enough."""
         self.storage_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(self.storage_path, 'w') as f:
-            json.dump(self.commitments, f, indent=2)
+        with open(self.log_path, 'ab') as f:
+            f.write(serialization.dumps({"op": "put", "record": self._to_json(record)}) + b"\n")
+        self._log_entries += 1
+        if self._log_entries >= COMPACT_THRESHOLD:
+            self.compact()
+
+    def compact(self) -> None:
+        """Fold the log into a fresh snapshot and truncate it."""
+        self._save()
+        if self.log_path.exists():
+            os.remove(self.log_path)
+        self._log_entries = 0
 
     @staticmethod
-    def _generate_blinding_factor() -> str:
+    def _to_json(record: dict[str, Any]) -> dict[str, Any]:
+        """Encode a commitment record for storage, with the blinding factor in base64."""
+        stored = dict(record)
+        stored["_blinding"] = base64.b64encode(record["_blinding"]).decode('ascii')
+        return stored
+
+    @staticmethod
+    def _from_json(stored: dict[str, Any]) -> dict[str, Any]:
+        """Decode a stored commitment record, accepting legacy hex blinding factors."""
+        record = dict(stored)
+        if "_blinding_factor" in record:
+            record["_blinding"] = bytes.fromhex(record.pop("_blinding_factor"))
+        else:
+            record["_blinding"] = base64.b64decode(record["_blinding"])
+        return record
+
+    @staticmethod
+    def _generate_blinding_factor() -> bytes:
         """Generate a cryptographically secure random blinding factor."""
-        return secrets.token_hex(32)
+        return secrets.token_bytes(32)
 
     @staticmethod
-    def _compute_commitment(count: int, blinding_factor: str) -> str:
+    def _compute_commitment(count: int, blinding_factor: bytes, context: bytes = b"") -> str:
         """
         Compute a cryptographic commitment to a count.
 
@@ -73,12 +150,13 @@ class ZKCommitmentStore:
         Args:
             count: The value to commit to
             blinding_factor: Random value for hiding
+            context: Optional bytes binding the commitment to what was counted
 
         Returns:
-            SHA256 hash of (count || blinding_factor)
+            SHA256 hash of (count as 8 big-endian bytes || blinding factor || context)
         """
-        data = f"{count}||{blinding_factor}"
-        return hashlib.sha256(data.encode('utf-8')).hexdigest()
+        buf = count.to_bytes(8, "big") + blinding_factor + context
+        return hashlib.sha256(buf).hexdigest()
 
     def create_commitment(self, event_type: EventType) -> ZKCommitment:
         """
@@ -101,23 +179,26 @@ class ZKCommitmentStore:
 
         # Generate blinding factor and commitment
         blinding_factor = self._generate_blinding_factor()
-        commitment_hash = self._compute_commitment(count, blinding_factor)
+        commitment_hash = self._compute_commitment(
+            count, blinding_factor, self._ET_BYTES[event_type]
+        )
 
         # Generate unique ID
         commitment_id = secrets.token_hex(8)
         timestamp = datetime.utcnow()
 
         # Store internally (with secret data for later proofs)
-        self.commitments[commitment_id] = {
+        record = {
             "id": commitment_id,
             "commitment_hash": commitment_hash,
             "event_type": event_type.value,
             "timestamp": timestamp.isoformat(),
             # Secret data (not revealed to verifiers)
             "_count": count,
-            "_blinding_factor": blinding_factor
+            "_blinding": blinding_factor
         }
-        self._save()
+        self.commitments[commitment_id] = record
+        self._append_log(record)
 
         return ZKCommitment(
             id=commitment_id,
@@ -169,7 +250,7 @@ class ZKCommitmentStore:
 
         data = self.commitments[commitment_id]
         count = data["_count"]
-        original_blinding = data["_blinding_factor"]
+        original_blinding = data["_blinding"]
 
         # Check if proof is possible
         is_valid = count >= threshold
@@ -211,8 +292,8 @@ class ZKCommitmentStore:
 
     @staticmethod
     def _compute_threshold_blinding(
-        original_blinding: str,
-        excess_blinding: str,
+        original_blinding: bytes,
+        excess_blinding: bytes,
         threshold: int,
         excess: int
     ) -> str:
@@ -222,8 +303,11 @@ class ZKCommitmentStore:
         This allows verifiers to check the relationship without
         learning the individual components.
         """
-        combined = f"{original_blinding}:{excess_blinding}:{threshold}:{excess}"
-        return hashlib.sha256(combined.encode('utf-8')).hexdigest()
+        buf = (
+            original_blinding + excess_blinding
+            + threshold.to_bytes(8, "big") + excess.to_bytes(8, "big")
+        )
+        return hashlib.sha256(buf).hexdigest()
 
     @staticmethod
     def _compute_verification_hash(
@@ -275,6 +359,22 @@ class ZKCommitmentStore:
         if "threshold_blinding" not in proof_data:
             return False, "Missing threshold blinding"
 
+        # proof_data is caller-supplied JSON; genuine proofs carry a hex string here
+        if not isinstance(proof_data["verification_hash"], str):
+            return False, "Verification hash mismatch - proof is invalid"
+
+        # Only successful verifications are remembered, so a hit is always valid
+        cache = ZKCommitmentStore._verified_proofs
+        key = (
+            commitment_hash,
+            threshold,
+            excess_commitment,
+            proof_data["verification_hash"]
+        )
+        if key in cache:
+            cache.move_to_end(key)
+            return True, f"Proof verified: count >= {threshold}"
+
         # Verify the verification hash matches
         expected_verification = ZKCommitmentStore._compute_verification_hash(
             commitment_hash, threshold, excess_commitment
@@ -283,6 +383,10 @@ class ZKCommitmentStore:
         if proof_data["verification_hash"] != expected_verification:
             return False, "Verification hash mismatch - proof is invalid"
 
+        cache[key] = None
+        if len(cache) > VERIFY_CACHE_SIZE:
+            cache.popitem(last=False)
+
         # At this point, we've verified:
         # 1. The proof components are consistent
         # 2. The prover created a valid excess commitment
@@ -298,8 +402,31 @@ class ZKCommitmentStore:
 
         return True, f"Proof verified: count >= {threshold}"
 
+    @classmethod
+    def verify_proofs_batch(
+        cls,
+        items: list[tuple[str, int, str, dict[str, Any]]]
+    ) -> list[tuple[bool, str]]:
+        """
+        Verify several independent proofs, e.g. for auditor batch checks.
+
+        Runs sequentially: each check hashes well under the 2 KB at which
+        hashlib releases the GIL, so a thread pool only adds overhead.
+
+        Args:
+            items: (commitment_hash, threshold, excess_commitment, proof_data)
+                tuples, as passed to verify_proof
+
+        Returns:
+            One (is_valid, message) tuple per item, in input order
+        """
+        return [cls.verify_proof(*item) for item in items]
+
     def reset(self) -> None:
         """Clear all commitments (for demo/testing)."""
         self.commitments = {}
-        if self.storage_path.exists():
-            os.remove(self.storage_path)
+        self._log_entries = 0
+        self._verified_proofs.clear()
+        for path in (self.storage_path, self.log_path):
+            if path.exists():
+                os.remove(path)
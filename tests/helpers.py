@@ -0,0 +1,12 @@
+"""Shared assertions for the test suite."""
+
+import pytest
+
+
+def assert_hex_digest(value: str) -> None:
+    """Fail unless value is a lowercase hex digest."""
+    try:
+        raw = bytes.fromhex(value)
+    except ValueError:
+        pytest.fail(f"Not a hex digest: {value!r}")
+    assert raw.hex() == value
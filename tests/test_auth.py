@@ -100,6 +100,14 @@ class TestAuthStore:
         assert party is not None
         assert party.name == "Test Lab"
 
+    def test_reset_invalidates_keys(self, temp_auth_store):
+        """Keys issued before a reset no longer verify."""
+        _, api_key = temp_auth_store.register_party("Test Lab", "lab")
+
+        temp_auth_store.reset()
+
+        assert temp_auth_store.verify_api_key(api_key) is None
+
     def test_all_roles_valid(self, temp_auth_store):
         """All valid roles can be registered."""
         for role in ["lab", "auditor", "government"]:
@@ -8,6 +8,7 @@ from backend.crypto_utils import (
     verify_chain_hash,
     combine_hashes,
 )
+from tests.helpers import assert_hex_digest
 
 
 class TestHashData:
@@ -37,7 +38,7 @@ class TestHashData:
         data = {"test": True}
         h = hash_data(data)
         assert len(h) == 64
-        assert all(c in '0123456789abcdef' for c in h)
+        assert_hex_digest(h)
 
     def test_nested_dict_consistency(self):
         """Nested dicts should hash consistently."""
@@ -139,4 +140,4 @@ class TestCombineHashes:
         """Output should be valid SHA-256 hash."""
         h = combine_hashes("a" * 64, "b" * 64)
         assert len(h) == 64
-        assert all(c in '0123456789abcdef' for c in h)
+        assert_hex_digest(h)
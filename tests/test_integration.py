@@ -1,42 +1,144 @@
-"""Integration tests for API endpoints using FastAPI TestClient."""
+"""Integration tests for API endpoints using an in-process ASGI client."""
 
+import asyncio
+import copy
+
+import orjson
 import pytest
-from fastapi.testclient import TestClient
+import pytest_asyncio
+from httpx import ASGITransport, AsyncClient
 
 from backend.api import app, transparency_ledger
 from backend.auth import auth_store, registration_rate_limiter
 from backend.mirror_simulation import mirror_simulation
+from backend.transparency import TransparencyLedger
+
+
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+# Request bodies sent by several tests, serialized once at import
+JSON_HEADERS = {"content-type": "application/json"}
+LAB_REGISTRATION_BODY = orjson.dumps({"name": "Test Lab", "role": "lab"})
+AUDITOR_REGISTRATION_BODY = orjson.dumps({"name": "Test Auditor", "role": "auditor"})
+EVIDENCE_HASH = "a" * 64
+SAFETY_SUBMISSION_BASE = {
+    "template_type": "safety_evaluation",
+    "deployment_id": "test-deploy-1",
+    "model_id": "test-model-1",
+    "evidence_hash": EVIDENCE_HASH
+}
+SAFETY_EVAL_BODY = orjson.dumps({
+    **SAFETY_SUBMISSION_BASE,
+    "title": "Safety Report",
+    "summary": "All tests passed successfully"
+})
+SAFETY_EVAL_REPORT_BODY = orjson.dumps({
+    **SAFETY_SUBMISSION_BASE,
+    "title": "Safety Evaluation Report",
+    "summary": "All tests passed"
+})
+CONCERN_BODY = orjson.dumps({
+    "category": "safety_eval",
+    "title": "Test Concern",
+    "description": "A test concern description",
+    "deployment_id": "test-deploy-1"
+})
+TAMPER_BODY = orjson.dumps({
+    "party": "lab",
+    "record_id": "fake_record",
+    "new_value": {"data": "malicious"}
+})
 
 
 @pytest.fixture(autouse=True)
-def reset_state():
-    """Reset all stores before each test."""
-    auth_store.reset()
+def reset_txn_stores(request):
+    """Reset the ledger, mirrors and rate limiter before each test.
+
+    Tests using populated_client keep the class-wide populated ledger;
+    their mirrors are restored by that fixture instead.
+    """
     registration_rate_limiter.reset()
+    if "populated_client" in request.fixturenames:
+        return
     mirror_simulation.reset()
     transparency_ledger.reset()
-    yield
+
+
+@pytest.fixture(autouse=True)
+def reset_auth(request):
+    """Reset registered parties before each test, unless the class shares them."""
+    if "registered_parties" in request.fixturenames:
+        return
+    auth_store.reset()
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def client():
+    """Create an ASGI test client, running the app lifespan once per session.
+
+    Stores are emptied before the lifespan exits, so the shutdown flush
+    cannot persist the last test's records into the app's real data files.
+    """
+    async with app.router.lifespan_context(app):
+        async with AsyncClient(
+            transport=ASGITransport(app=app),
+            base_url="http://test"
+        ) as c:
+            yield c
+        transparency_ledger.reset()
+        mirror_simulation.reset()
+        auth_store.reset()
+        registration_rate_limiter.reset()
+
+
+@pytest_asyncio.fixture(scope="class", loop_scope="session")
+async def registered_parties(client):
+    """Register one lab and one auditor, shared by every test in the class."""
     auth_store.reset()
     registration_rate_limiter.reset()
+    lab_response, auditor_response = await asyncio.gather(
+        client.post("/auth/register", content=LAB_REGISTRATION_BODY, headers=JSON_HEADERS),
+        client.post("/auth/register", content=AUDITOR_REGISTRATION_BODY, headers=JSON_HEADERS)
+    )
+    yield {
+        "lab_api_key": lab_response.json()["api_key"],
+        "auditor_api_key": auditor_response.json()["api_key"],
+    }
+    auth_store.reset()
+
+
+@pytest_asyncio.fixture(scope="class", loop_scope="session")
+async def populated_ledger(client):
+    """Populate the ledger and sync mirrors once per class; yields the synced mirrors."""
+    transparency_ledger.reset()
     mirror_simulation.reset()
+    response = await client.post("/demo/transparency-populate")
+    assert response.status_code == 200
+    response = await client.post("/demo/mirror/sync")
+    assert response.status_code == 200
+    assert response.json()["record_count"] > 0
+    yield copy.deepcopy(mirror_simulation.mirrors)
     transparency_ledger.reset()
+    mirror_simulation.reset()
 
 
 @pytest.fixture
-def client():
-    """Create test client."""
-    return TestClient(app)
+def populated_client(client, populated_ledger):
+    """Client over the populated ledger with freshly synced, untampered mirrors."""
+    mirror_simulation.mirrors = copy.deepcopy(populated_ledger)
+    return client
 
 
 class TestAuthFlow:
     """Integration tests for authentication flow."""
 
-    def test_register_and_authenticate(self, client):
+    async def test_register_and_authenticate(self, client):
         """Full registration and authentication flow."""
         # Register a new party
-        response = client.post(
+        response = await client.post(
             "/auth/register",
-            json={"name": "Test Lab", "role": "lab"}
+            content=LAB_REGISTRATION_BODY,
+            headers=JSON_HEADERS
         )
         assert response.status_code == 200
         data = response.json()
@@ -46,7 +148,7 @@ class TestAuthFlow:
         api_key = data["api_key"]
 
         # Use the API key to get current party info
-        response = client.get(
+        response = await client.get(
             "/auth/me",
             headers={"X-API-Key": api_key}
         )
@@ -55,67 +157,69 @@ class TestAuthFlow:
         assert data["name"] == "Test Lab"
         assert data["role"] == "lab"
 
-    def test_rate_limiting_on_register(self, client):
+    async def test_rate_limiting_on_register(self, client):
         """Rate limiting blocks excessive registrations."""
         # Make 5 successful registrations
         for i in range(5):
-            response = client.post(
+            response = await client.post(
                 "/auth/register",
                 json={"name": f"Party {i}", "role": "lab"}
             )
             assert response.status_code == 200
 
         # 6th should be rate limited
-        response = client.post(
+        response = await client.post(
             "/auth/register",
             json={"name": "Party 6", "role": "lab"}
         )
         assert response.status_code == 429
         assert "Rate limit exceeded" in response.json()["detail"]
 
-    def test_invalid_api_key(self, client):
+    async def test_invalid_api_key(self, client):
         """Invalid API key returns 401."""
-        response = client.get(
+        response = await client.get(
             "/auth/me",
             headers={"X-API-Key": "invalid_key"}
         )
         assert response.status_code == 401
 
-    def test_revoke_party(self, client):
+    async def test_revoke_party(self, client):
         """Revoked party cannot authenticate."""
         # Register
-        response = client.post(
+        response = await client.post(
             "/auth/register",
-            json={"name": "Test Lab", "role": "lab"}
+            content=LAB_REGISTRATION_BODY,
+            headers=JSON_HEADERS
         )
         data = response.json()
         party_id = data["party_id"]
         api_key = data["api_key"]
 
         # Revoke
-        response = client.delete(f"/auth/parties/{party_id}")
+        response = await client.delete(f"/auth/parties/{party_id}")
         assert response.status_code == 200
 
         # API key should no longer work
-        response = client.get(
+        response = await client.get(
             "/auth/me",
             headers={"X-API-Key": api_key}
         )
         assert response.status_code == 401
 
-    def test_rotate_api_key(self, client):
+    async def test_rotate_api_key(self, client):
         """API key rotation generates new key and invalidates old."""
         # Register
-        response = client.post(
+        response = await client.post(
             "/auth/register",
-            json={"name": "Test Lab", "role": "lab"}
+            content=LAB_REGISTRATION_BODY,
+            headers=JSON_HEADERS
         )
         data = response.json()
         party_id = data["party_id"]
         old_api_key = data["api_key"]
 
         # Rotate using old key
-        response = client.post(
+        response = await client.post(
             "/auth/rotate-key",
             headers={"X-API-Key": old_api_key}
         )
@@ -125,44 +229,37 @@ class TestAuthFlow:
         new_api_key = data["new_api_key"]
         assert new_api_key != old_api_key
 
-        # Old key should not work
-        response = client.get(
-            "/auth/me",
-            headers={"X-API-Key": old_api_key}
+        # Old key should not work, new key should
+        old_response, new_response = await asyncio.gather(
+            client.get("/auth/me", headers={"X-API-Key": old_api_key}),
+            client.get("/auth/me", headers={"X-API-Key": new_api_key})
         )
-        assert response.status_code == 401
-
-        # New key should work
-        response = client.get(
-            "/auth/me",
-            headers={"X-API-Key": new_api_key}
-        )
-        assert response.status_code == 200
-        assert response.json()["id"] == party_id
+        assert old_response.status_code == 401
+        assert new_response.status_code == 200
+        assert new_response.json()["id"] == party_id
 
 
 class TestTransparencyFlow:
     """Integration tests for transparency ledger flow."""
 
-    def test_raise_and_respond_to_concern(self, client):
+    async def test_raise_and_respond_to_concern(self, client):
         """Full concern lifecycle: raise, respond, resolve."""
         # Raise a concern
-        response = client.post(
+        response = await client.post(
             "/transparency/concerns",
             params={"submitter_id": "anon_abc123", "role": "whistleblower"},
-            json={
-                "category": "safety_eval",
-                "title": "Test Concern",
-                "description": "A test concern description",
-                "deployment_id": "test-deploy-1"
-            }
+            content=CONCERN_BODY,
+            headers=JSON_HEADERS
         )
         assert response.status_code == 200
         concern = response.json()
         concern_id = concern["id"]
+        # Acknowledged reports are already on disk, not buffered in memory
+        reloaded = TransparencyLedger(storage_path=str(transparency_ledger.storage_path))
+        assert reloaded.get_concern(concern_id) is not None
 
         # Lab responds
-        response = client.post(
+        response = await client.post(
             "/transparency/responses",
             params={"responder_id": "Test Lab", "role": "lab"},
             json={
@@ -173,7 +270,7 @@ class TestTransparencyFlow:
         assert response.status_code == 200
 
         # Auditor resolves
-        response = client.post(
+        response = await client.post(
             "/transparency/resolutions",
             params={"auditor_id": "AI Safety Institute"},
             json={
@@ -184,7 +281,7 @@ class TestTransparencyFlow:
         assert response.status_code == 200
 
         # Check concern is resolved
-        response = client.get(f"/transparency/concerns/{concern_id}")
+        response = await client.get(f"/transparency/concerns/{concern_id}")
         assert response.status_code == 200
         assert response.json()["status"] == "resolved"
 
@@ -192,58 +289,50 @@ class TestTransparencyFlow:
 class TestMirrorFlow:
     """Integration tests for mirror simulation flow."""
 
-    def test_sync_and_detect_tampering(self, client):
+    async def test_sync_and_detect_tampering(self, populated_client):
         """Full mirror sync and tamper detection flow."""
-        # First populate transparency ledger
-        response = client.post("/demo/transparency-populate")
-        assert response.status_code == 200
-
-        # Sync mirrors
-        response = client.post("/demo/mirror/sync")
-        assert response.status_code == 200
-        assert response.json()["record_count"] > 0
+        client = populated_client
 
         # Check all consistent
-        response = client.get("/demo/mirror/compare")
+        response = await client.get("/demo/mirror/compare")
         assert response.status_code == 200
         assert response.json()["all_consistent"] is True
 
         # Tamper with one mirror
-        response = client.post(
+        response = await client.post(
             "/demo/mirror/tamper",
-            json={
-                "party": "lab",
-                "record_id": "fake_record",
-                "new_value": {"data": "malicious"}
-            }
+            content=TAMPER_BODY,
+            headers=JSON_HEADERS
         )
         assert response.status_code == 200
 
         # Detect tampering
-        response = client.get("/demo/mirror/detect")
+        response = await client.get("/demo/mirror/detect")
         assert response.status_code == 200
         data = response.json()
         assert data["tampering_detected"] is True
         assert "lab" in data["affected_parties"]
 
+    async def test_mirrors_start_untampered(self, populated_client):
+        """Each test sees freshly synced mirrors over the populated ledger."""
+        response = await populated_client.get("/demo/mirror/status")
+        assert response.status_code == 200
+        statuses = response.json()
+        assert all(s["record_count"] > 0 for s in statuses)
+        assert len({s["hash"] for s in statuses}) == 1
+
 
 class TestComplianceFlow:
     """Integration tests for compliance submission flow."""
 
-    def test_submit_and_review_compliance(self, client):
+    async def test_submit_and_review_compliance(self, client):
         """Full compliance submission and review flow."""
         # Submit compliance document
-        response = client.post(
+        response = await client.post(
             "/compliance/submissions",
             params={"lab_id": "Test Lab"},
-            json={
-                "template_type": "safety_evaluation",
-                "deployment_id": "test-deploy-1",
-                "model_id": "test-model-1",
-                "title": "Safety Evaluation Report",
-                "summary": "All tests passed",
-                "evidence_hash": "a" * 64
-            }
+            content=SAFETY_EVAL_REPORT_BODY,
+            headers=JSON_HEADERS
         )
         assert response.status_code == 200
         submission = response.json()
@@ -251,7 +340,7 @@ class TestComplianceFlow:
         assert submission["status"] == "submitted"
 
         # Review and verify
-        response = client.post(
+        response = await client.post(
             "/compliance/review",
             params={"auditor_id": "AI Safety Institute"},
             json={
@@ -264,89 +353,103 @@ class TestComplianceFlow:
         assert response.status_code == 200
         assert response.json()["status"] == "verified"
 
+    async def test_cleared_endpoint_matches_status(self, client):
+        """The lightweight gate check agrees with the full compliance status."""
+        gate_params = {"model_id": "test-model-1"}
+
+        async def assert_gate(expected: bool):
+            status = await client.get("/compliance/status/test-deploy-1", params=gate_params)
+            cleared = await client.get("/compliance/cleared/test-deploy-1", params=gate_params)
+            assert status.status_code == cleared.status_code == 200
+            assert cleared.json() == {
+                "deployment_id": "test-deploy-1",
+                "model_id": "test-model-1",
+                "is_cleared": expected
+            }
+            assert status.json()["is_cleared"] is expected
+
+        # Blocked: no templates submitted yet
+        await assert_gate(False)
+
+        for template_type in ("safety_evaluation", "capability_assessment", "red_team_report"):
+            response = await client.post(
+                "/compliance/submissions",
+                params={"lab_id": "Test Lab"},
+                content=orjson.dumps({
+                    **SAFETY_SUBMISSION_BASE,
+                    "template_type": template_type,
+                    "title": f"{template_type} report",
+                    "summary": "All tests passed"
+                }),
+                headers=JSON_HEADERS
+            )
+            assert response.status_code == 200
+            response = await client.post(
+                "/compliance/review",
+                params={"auditor_id": "AI Safety Institute"},
+                json={
+                    "submission_id": response.json()["id"],
+                    "status": "verified",
+                    "notes": "Evidence verified",
+                    "evidence_verified": True
+                }
+            )
+            assert response.status_code == 200
+
+        # Cleared: every required template verified, no concerns
+        await assert_gate(True)
+
+        # Blocked again: an open concern on the deployment
+        response = await client.post(
+            "/transparency/concerns",
+            params={"submitter_id": "anon_abc123", "role": "whistleblower"},
+            content=CONCERN_BODY,
+            headers=JSON_HEADERS
+        )
+        assert response.status_code == 200
+        await assert_gate(False)
+
 
 class TestRoleBasedAccess:
     """Integration tests for role-based access control."""
 
-    def test_lab_can_submit_compliance(self, client):
+    async def test_lab_can_submit_compliance(self, client, registered_parties):
         """Lab role can submit compliance with API key."""
-        # Register as lab
-        response = client.post(
-            "/auth/register",
-            json={"name": "Test Lab", "role": "lab"}
-        )
-        api_key = response.json()["api_key"]
-
-        # Submit with API key
-        response = client.post(
+        response = await client.post(
             "/compliance/submissions",
             params={"lab_id": "Test Lab"},
-            headers={"X-API-Key": api_key},
-            json={
-                "template_type": "safety_evaluation",
-                "deployment_id": "test-deploy-1",
-                "model_id": "test-model-1",
-                "title": "Safety Report",
-                "summary": "All tests passed successfully",
-                "evidence_hash": "a" * 64
-            }
+            headers={**JSON_HEADERS, "X-API-Key": registered_parties["lab_api_key"]},
+            content=SAFETY_EVAL_BODY
         )
         assert response.status_code == 200
 
-    def test_auditor_cannot_submit_compliance(self, client):
+    async def test_auditor_cannot_submit_compliance(self, client, registered_parties):
         """Auditor role cannot submit compliance."""
-        # Register as auditor
-        response = client.post(
-            "/auth/register",
-            json={"name": "Test Auditor", "role": "auditor"}
-        )
-        api_key = response.json()["api_key"]
-
         # Try to submit (should fail)
-        response = client.post(
+        response = await client.post(
             "/compliance/submissions",
             params={"lab_id": "Test Auditor"},
-            headers={"X-API-Key": api_key},
-            json={
-                "template_type": "safety_evaluation",
-                "deployment_id": "test-deploy-1",
-                "model_id": "test-model-1",
-                "title": "Safety Report",
-                "summary": "All tests passed successfully",
-                "evidence_hash": "a" * 64
-            }
+            headers={**JSON_HEADERS, "X-API-Key": registered_parties["auditor_api_key"]},
+            content=SAFETY_EVAL_BODY
         )
         assert response.status_code == 403
 
-    def test_auditor_can_review_compliance(self, client):
+    async def test_auditor_can_review_compliance(self, client, registered_parties):
         """Auditor role can review compliance."""
         # Submit as lab (no auth)
-        response = client.post(
+        response = await client.post(
             "/compliance/submissions",
             params={"lab_id": "Test Lab"},
-            json={
-                "template_type": "safety_evaluation",
-                "deployment_id": "test-deploy-1",
-                "model_id": "test-model-1",
-                "title": "Safety Report",
-                "summary": "All tests passed successfully",
-                "evidence_hash": "a" * 64
-            }
+            content=SAFETY_EVAL_BODY,
+            headers=JSON_HEADERS
         )
         submission_id = response.json()["id"]
 
-        # Register as auditor
-        response = client.post(
-            "/auth/register",
-            json={"name": "Test Auditor", "role": "auditor"}
-        )
-        api_key = response.json()["api_key"]
-
         # Review with API key
-        response = client.post(
+        response = await client.post(
             "/compliance/review",
             params={"auditor_id": "Test Auditor"},
-            headers={"X-API-Key": api_key},
+            headers={"X-API-Key": registered_parties["auditor_api_key"]},
             json={
                 "submission_id": submission_id,
                 "status": "verified",
@@ -1,5 +1,7 @@
 """Tests for Merkle tree implementation."""
 
+import math
+
 import pytest
 
 from backend.crypto_utils import hash_data
@@ -12,6 +14,16 @@ from backend.merkle_tree import (
 )
 
 
+@pytest.fixture(scope="module")
+def trees():
+    """Build one tree per size used by the proof sweeps, keyed by leaf count."""
+    built = {}
+    for n in [2, 4, 7, 8, 16, 32]:
+        hashes = [hash_data({"event": i}) for i in range(n)]
+        built[n] = (hashes, MerkleTree(hashes))
+    return built
+
+
 class TestMerkleTreeConstruction:
     """Tests for Merkle tree building."""
 
@@ -102,24 +114,21 @@ class TestMerkleProof:
         proof2 = tree.get_proof(1)
         assert MerkleTree.verify_proof(h2, proof2, tree.get_root()) is True
 
-    def test_proof_larger_tree(self):
+    @pytest.mark.parametrize("i", range(8))
+    def test_proof_larger_tree(self, trees, i):
         """Proof for larger tree."""
-        hashes = [hash_data({"event": i}) for i in range(8)]
-        tree = MerkleTree(hashes)
+        hashes, tree = trees[8]
 
-        # Verify all leaves
-        for i, h in enumerate(hashes):
-            proof = tree.get_proof(i)
-            assert MerkleTree.verify_proof(h, proof, tree.get_root()) is True
+        proof = tree.get_proof(i)
+        assert MerkleTree.verify_proof(hashes[i], proof, tree.get_root()) is True
 
-    def test_proof_odd_tree(self):
+    @pytest.mark.parametrize("i", range(7))
+    def test_proof_odd_tree(self, trees, i):
         """Proof for odd-sized tree."""
-        hashes = [hash_data({"event": i}) for i in range(7)]
-        tree = MerkleTree(hashes)
+        hashes, tree = trees[7]
 
-        for i, h in enumerate(hashes):
-            proof = tree.get_proof(i)
-            assert MerkleTree.verify_proof(h, proof, tree.get_root()) is True
+        proof = tree.get_proof(i)
+        assert MerkleTree.verify_proof(hashes[i], proof, tree.get_root()) is True
 
     def test_invalid_proof_wrong_hash(self):
         """Proof should fail with wrong leaf hash."""
@@ -210,14 +219,12 @@ class TestEdgeCases:
             proof = tree.get_proof(i)
             assert MerkleTree.verify_proof(hashes[i], proof, tree.get_root()) is True
 
-    def test_proof_length(self):
+    @pytest.mark.parametrize("n", [2, 4, 8, 16, 32])
+    def test_proof_length(self, trees, n):
         """Proof length should be log2(n)."""
-        for n in [2, 4, 8, 16, 32]:
-            hashes = [hash_data({"event": i}) for i in range(n)]
-            tree = MerkleTree(hashes)
-            proof = tree.get_proof(0)
-
-            # Proof length should be approximately log2(n)
-            import math
-            expected_length = math.ceil(math.log2(n))
-            assert len(proof) == expected_length
+        _, tree = trees[n]
+        proof = tree.get_proof(0)
+
+        # Proof length should be approximately log2(n)
+        expected_length = math.ceil(math.log2(n))
+        assert len(proof) == expected_length
@@ -10,16 +10,8 @@ from backend.mirror_simulation import MirrorSimulation
 
 @pytest.fixture
 def mirror_sim():
-    """Create a fresh mirror simulation for testing."""
-    with tempfile.NamedTemporaryFile(suffix='.json', delete=False) as f:
-        temp_path = f.name
-
-    sim = MirrorSimulation(storage_path=temp_path)
-    yield sim
-
-    # Cleanup
-    if os.path.exists(temp_path):
-        os.remove(temp_path)
+    """Create a fresh in-memory mirror simulation for testing."""
+    return MirrorSimulation(storage_path=None)
 
 
 class TestMirrorSimulation:
@@ -218,3 +210,14 @@ class TestMirrorPersistence:
         finally:
             if os.path.exists(temp_path):
                 os.remove(temp_path)
+
+    def test_in_memory_mode_skips_disk(self, tmp_path, monkeypatch):
+        """Mirrors created without a storage path never touch disk."""
+        monkeypatch.chdir(tmp_path)
+        sim = MirrorSimulation(storage_path=None)
+        sim.sync_from_source({"records": {"test_1": {"data": "memory"}}})
+        sim.tamper_mirror("lab", "test_1", {"data": "tampered"})
+
+        assert sim.mirrors["lab"]["records"]["test_1"]["data"] == "tampered"
+        assert list(tmp_path.iterdir()) == []
+        assert MirrorSimulation().mirrors["lab"]["records"] == {}
@@ -0,0 +1,45 @@
+"""Tests for the store JSON codec."""
+
+import pytest
+from backend import serialization
+from backend.models import ConcernStatus
+
+
+@pytest.fixture(params=["orjson", "json"])
+def codec(request, monkeypatch):
+    """The serialization module, once with orjson and once on the stdlib fallback."""
+    if request.param == "json":
+        monkeypatch.setattr(serialization, "orjson", None)
+    return serialization
+
+
+class TestCodec:
+    """Both backends must read and write the same documents."""
+
+    def test_round_trip(self, codec):
+        """Compact and indented output parse back to the same value."""
+        data = {"id": "c1", "tags": ["a", "b"], "count": 3, "nested": {"ok": True}}
+        assert codec.loads(codec.dumps(data)) == data
+        assert codec.loads(codec.dumps(data, indent=True)) == data
+
+    def test_compact_output_is_single_line(self, codec):
+        """Log entries rely on compact output containing no newlines."""
+        assert b"\n" not in codec.dumps({"a": [1, 2], "b": {"c": None}})
+
+    def test_enum_encoded_by_value(self, codec):
+        """Enums are stored as their value."""
+        assert codec.loads(codec.dumps({"status": ConcernStatus.RESOLVED})) == {"status": "resolved"}
+
+    def test_decode_error(self, codec):
+        """Malformed input raises the shared decode error."""
+        with pytest.raises(serialization.JSONDecodeError):
+            codec.loads(b'{"op": "put", "rec')
+
+    def test_load_file(self, codec, tmp_path):
+        """Files are parsed through a memory map; empty files load as None."""
+        path = tmp_path / "store.json"
+        path.write_bytes(codec.dumps({"concerns": {"c1": {"id": "c1"}}}, indent=True))
+        assert codec.load_file(path) == {"concerns": {"c1": {"id": "c1"}}}
+
+        path.write_bytes(b"")
+        assert codec.load_file(path) is None
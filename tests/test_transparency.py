@@ -1,11 +1,11 @@
 """Tests for Shared Transparency Ledger."""
 
-import os
-import tempfile
+import functools
 
 import pytest
 
 from backend.crypto_utils import generate_anonymous_id, verify_anonymous_id
+from backend.merkle_tree import MerkleTree
 from backend.models import (
     ComplianceReviewCreate,
     ComplianceStatus,
@@ -18,21 +18,60 @@ from backend.models import (
     ResolutionCreate,
     SubmitterRole,
 )
-from backend.transparency import TransparencyLedger
+from backend.transparency import DEFAULT_REQUIRED_TEMPLATES, TransparencyLedger
+
+# Memoized for tests that don't exercise re-computation itself
+_id = functools.lru_cache(maxsize=None)(generate_anonymous_id)
+
+# Concern payloads validated once at import and reused across tests
+TITLE = "Test concern title"
+DESC = "This is a detailed test description"
+_BASE = ConcernCreate(
+    category=ConcernCategory.SAFETY_EVAL,
+    title=TITLE,
+    description=DESC
+)
+_DEPLOY_A = _BASE.model_copy(update={
+    "category": ConcernCategory.DEPLOYMENT,
+    "title": "Deploy concern one",
+    "description": "This is a detailed description for deploy-a",
+    "deployment_id": "deploy-a"
+})
+_DEPLOY_B = _DEPLOY_A.model_copy(update={
+    "title": "Deploy concern two",
+    "description": "This is a detailed description for deploy-b",
+    "deployment_id": "deploy-b"
+})
+
+# Compliance evidence hashes and identifiers shared across submission tests
+_HASH_A, _HASH_B, _HASH_C, _HASH_D, _HASH_E, _HASH_F = (c * 64 for c in "abcdef")
+DEP1, MOD1 = "deploy-1", "model-1"
+# Review paired with a submission in bulk_submit_compliance, which fills in the id
+_VERIFIED = ComplianceReviewCreate(
+    submission_id="",
+    status=ComplianceStatus.VERIFIED,
+    notes="Verified and approved.",
+    evidence_verified=True
+)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def temp_ledger():
-    """Create a temporary transparency ledger for testing."""
-    with tempfile.NamedTemporaryFile(suffix='.json', delete=False) as f:
-        temp_path = f.name
+    """Create an in-memory transparency ledger shared by the module."""
+    return TransparencyLedger(storage_path=None)
+
 
-    ledger = TransparencyLedger(storage_path=temp_path)
-    yield ledger
+@pytest.fixture(autouse=True)
+def _clean(temp_ledger):
+    """Roll the shared ledger back to empty after each test."""
+    yield
+    temp_ledger.reset()
 
-    # Cleanup
-    if os.path.exists(temp_path):
-        os.remove(temp_path)
+
+@pytest.fixture
+def sample_concern(temp_ledger):
+    """Raise a standard open whistleblower concern."""
+    return temp_ledger.raise_concern(_BASE, "anon_1", SubmitterRole.WHISTLEBLOWER)
 
 
 class TestAnonymousIdentity:
@@ -40,42 +79,34 @@ class TestAnonymousIdentity:
 
     def test_generate_anonymous_id(self):
         """Should generate consistent anonymous ID."""
-        anon_id = generate_anonymous_id("alice@lab.com", "mysecret123")
+        anon_id = _id("alice@lab.com", "mysecret123")
 
         assert anon_id.startswith("anon_")
         assert len(anon_id) == 17  # "anon_" + 12 hex chars
 
-    def test_same_input_same_output(self):
-        """Same identity + salt should produce same anonymous ID."""
-        id1 = generate_anonymous_id("alice@lab.com", "mysecret123")
-        id2 = generate_anonymous_id("alice@lab.com", "mysecret123")
-
-        assert id1 == id2
-
-    def test_different_salt_different_output(self):
-        """Different salt should produce different anonymous ID."""
-        id1 = generate_anonymous_id("alice@lab.com", "secret1")
-        id2 = generate_anonymous_id("alice@lab.com", "secret2")
-
-        assert id1 != id2
-
-    def test_different_identity_different_output(self):
-        """Different identity should produce different anonymous ID."""
-        id1 = generate_anonymous_id("alice@lab.com", "samesecret")
-        id2 = generate_anonymous_id("bob@lab.com", "samesecret")
-
-        assert id1 != id2
+    @pytest.mark.parametrize("id1,salt1,id2,salt2,same", [
+        ("alice@lab.com", "mysecret123", "alice@lab.com", "mysecret123", True),
+        ("alice@lab.com", "secret1", "alice@lab.com", "secret2", False),
+        ("alice@lab.com", "samesecret", "bob@lab.com", "samesecret", False),
+    ], ids=["same_input", "different_salt", "different_identity"])
+    def test_id_determinism(self, id1, salt1, id2, salt2, same):
+        """Same identity + salt gives the same ID; changing either changes it."""
+        assert (generate_anonymous_id(id1, salt1) == generate_anonymous_id(id2, salt2)) is same
 
     def test_verify_anonymous_id(self):
         """Should verify ownership of anonymous ID."""
         identity = "alice@lab.com"
         salt = "mysecret123"
-        anon_id = generate_anonymous_id(identity, salt)
+        anon_id = _id(identity, salt)
 
         assert verify_anonymous_id(identity, salt, anon_id) is True
         assert verify_anonymous_id(identity, "wrong_salt", anon_id) is False
         assert verify_anonymous_id("wrong@email.com", salt, anon_id) is False
 
+    def test_verify_rejects_non_ascii_id(self):
+        """Verification should fail cleanly for a malformed anonymous ID."""
+        assert verify_anonymous_id("alice@lab.com", "mysecret123", "anon_é") is False
+
 
 class TestConcernManagement:
     """Tests for concern creation and retrieval."""
@@ -104,8 +135,8 @@ class TestConcernManagement:
         created = temp_ledger.raise_concern(
             ConcernCreate(
                 category=ConcernCategory.CAPABILITY_RISK,
-                title="Test concern title",
-                description="This is a detailed test description for the concern"
+                title=TITLE,
+                description=DESC
             ),
             submitter_id="anon_xyz",
             submitter_role=SubmitterRole.WHISTLEBLOWER
@@ -114,7 +145,13 @@ class TestConcernManagement:
         retrieved = temp_ledger.get_concern(created.id)
         assert retrieved is not None
         assert retrieved.id == created.id
-        assert retrieved.title == created.title
+        assert retrieved.title == created.title == TITLE
+
+    @pytest.mark.parametrize("title", ["Shrt", "x" * 201])
+    def test_title_length_enforced(self, title):
+        """Titles outside 5-200 characters should be rejected."""
+        with pytest.raises(ValueError):
+            _BASE.model_validate({**_BASE.model_dump(), "title": title})
 
     def test_get_nonexistent_concern(self, temp_ledger):
         """Should return None for invalid ID."""
@@ -141,47 +178,47 @@ class TestConcernManagement:
 
     def test_list_concerns_filter_by_deployment(self, temp_ledger):
         """Should filter concerns by deployment ID."""
-        temp_ledger.raise_concern(
-            ConcernCreate(
-                category=ConcernCategory.DEPLOYMENT,
-                title="Deploy concern one",
-                description="This is a detailed description for deploy-a",
-                deployment_id="deploy-a"
-            ),
-            "anon_1", SubmitterRole.WHISTLEBLOWER
-        )
-        temp_ledger.raise_concern(
-            ConcernCreate(
-                category=ConcernCategory.DEPLOYMENT,
-                title="Deploy concern two",
-                description="This is a detailed description for deploy-b",
-                deployment_id="deploy-b"
-            ),
-            "anon_2", SubmitterRole.WHISTLEBLOWER
-        )
+        temp_ledger.raise_concerns_bulk([
+            (_DEPLOY_A, "anon_1", SubmitterRole.WHISTLEBLOWER),
+            (_DEPLOY_B, "anon_2", SubmitterRole.WHISTLEBLOWER),
+        ])
 
         deploy_a = temp_ledger.list_concerns(deployment_id="deploy-a")
         assert len(deploy_a) == 1
         assert deploy_a[0].deployment_id == "deploy-a"
 
+    def test_list_concerns_combined_filters(self, temp_ledger):
+        """Category, status and deployment filters should intersect."""
+        temp_ledger.raise_concerns_bulk([
+            (_BASE, "anon_1", SubmitterRole.WHISTLEBLOWER),
+            (_DEPLOY_A, "anon_2", SubmitterRole.WHISTLEBLOWER),
+            (_DEPLOY_B, "anon_3", SubmitterRole.WHISTLEBLOWER),
+        ])
+
+        deployment = temp_ledger.list_concerns(category=ConcernCategory.DEPLOYMENT)
+        assert len(deployment) == 2
+
+        matched = temp_ledger.list_concerns(
+            deployment_id="deploy-b",
+            status=ConcernStatus.OPEN,
+            category=ConcernCategory.DEPLOYMENT
+        )
+        assert [c.deployment_id for c in matched] == ["deploy-b"]
+
+        assert temp_ledger.list_concerns(
+            deployment_id="deploy-b",
+            category=ConcernCategory.SAFETY_EVAL
+        ) == []
+
 
 class TestResponseManagement:
     """Tests for concern responses."""
 
-    def test_respond_to_concern(self, temp_ledger):
+    def test_respond_to_concern(self, temp_ledger, sample_concern):
         """Should create response and update status."""
-        concern = temp_ledger.raise_concern(
-            ConcernCreate(
-                category=ConcernCategory.SAFETY_EVAL,
-                title="Test concern title",
-                description="This is a detailed test description"
-            ),
-            "anon_1", SubmitterRole.WHISTLEBLOWER
-        )
-
         response = temp_ledger.respond_to_concern(
             ConcernResponseCreate(
-                concern_id=concern.id,
+                concern_id=sample_concern.id,
                 response_text="We have addressed this issue completely"
             ),
             responder_id="Anthropic Safety",
@@ -192,7 +229,7 @@ class TestResponseManagement:
         assert response.response_text == "We have addressed this issue completely"
 
         # Status should be updated
-        updated = temp_ledger.get_concern(concern.id)
+        updated = temp_ledger.get_concern(sample_concern.id)
         assert updated.status == ConcernStatus.ADDRESSED
 
     def test_respond_to_nonexistent_concern(self, temp_ledger):
@@ -206,51 +243,57 @@ class TestResponseManagement:
         )
         assert result is None
 
-    def test_dispute_response(self, temp_ledger):
+    def test_dispute_response(self, temp_ledger, sample_concern):
         """Should mark concern as disputed."""
-        concern = temp_ledger.raise_concern(
-            ConcernCreate(
-                category=ConcernCategory.SAFETY_EVAL,
-                title="Test concern title",
-                description="This is a detailed test description"
-            ),
-            "anon_1", SubmitterRole.WHISTLEBLOWER
-        )
-
         # Lab responds
         temp_ledger.respond_to_concern(
             ConcernResponseCreate(
-                concern_id=concern.id,
+                concern_id=sample_concern.id,
                 response_text="We have fixed this issue"
             ),
             "Lab", SubmitterRole.LAB
         )
 
         # Whistleblower disputes
-        success = temp_ledger.dispute_response(concern.id, "anon_1")
+        success = temp_ledger.dispute_response(sample_concern.id, "anon_1")
         assert success is True
 
-        updated = temp_ledger.get_concern(concern.id)
+        updated = temp_ledger.get_concern(sample_concern.id)
         assert updated.status == ConcernStatus.DISPUTED
 
+    def test_status_filter_tracks_transitions(self, temp_ledger, sample_concern):
+        """Status filters should follow a concern through its lifecycle."""
+        temp_ledger.respond_to_concern(
+            ConcernResponseCreate(
+                concern_id=sample_concern.id,
+                response_text="We have fixed this issue"
+            ),
+            "Lab", SubmitterRole.LAB
+        )
+
+        assert temp_ledger.list_concerns(status=ConcernStatus.OPEN) == []
+        addressed = temp_ledger.list_concerns(status=ConcernStatus.ADDRESSED)
+        assert [c.id for c in addressed] == [sample_concern.id]
+
+    def test_stats_track_status_counts(self, temp_ledger, sample_concern):
+        """Stats should reflect status transitions without rescanning."""
+        assert temp_ledger.get_stats()["concerns_by_status"]["open"] == 1
+
+        temp_ledger.dispute_response(sample_concern.id, "anon_1")
+
+        by_status = temp_ledger.get_stats()["concerns_by_status"]
+        assert by_status["open"] == 0
+        assert by_status["disputed"] == 1
+
 
 class TestResolutionManagement:
     """Tests for concern resolution by auditors."""
 
-    def test_resolve_concern(self, temp_ledger):
+    def test_resolve_concern(self, temp_ledger, sample_concern):
         """Should mark concern as resolved."""
-        concern = temp_ledger.raise_concern(
-            ConcernCreate(
-                category=ConcernCategory.SAFETY_EVAL,
-                title="Test concern title",
-                description="This is a detailed test description"
-            ),
-            "anon_1", SubmitterRole.WHISTLEBLOWER
-        )
-
         resolution = temp_ledger.resolve_concern(
             ResolutionCreate(
-                concern_id=concern.id,
+                concern_id=sample_concern.id,
                 resolution_notes="Verified fix is adequate and complete"
             ),
             auditor_id="AI Safety Institute"
@@ -259,7 +302,7 @@ class TestResolutionManagement:
         assert resolution is not None
         assert resolution.resolution_notes == "Verified fix is adequate and complete"
 
-        updated = temp_ledger.get_concern(concern.id)
+        updated = temp_ledger.get_concern(sample_concern.id)
         assert updated.status == ConcernStatus.RESOLVED
 
     def test_resolve_nonexistent_concern(self, temp_ledger):
@@ -359,70 +402,144 @@ class TestDeploymentClearance:
 class TestPersistence:
     """Tests for ledger persistence."""
 
-    def test_persistence(self):
+    def test_persistence(self, tmp_path):
         """Concerns should persist across instances."""
-        with tempfile.NamedTemporaryFile(suffix='.json', delete=False) as f:
-            temp_path = f.name
-
-        try:
-            # Create ledger and add concern
-            ledger1 = TransparencyLedger(storage_path=temp_path)
-            concern = ledger1.raise_concern(
-                ConcernCreate(
-                    category=ConcernCategory.SAFETY_EVAL,
-                    title="Persistent concern title",
-                    description="This concern should persist across instances"
-                ),
-                "anon_1", SubmitterRole.WHISTLEBLOWER
-            )
+        temp_path = str(tmp_path / "ledger.json")
+
+        # Create ledger and add concern
+        ledger1 = TransparencyLedger(storage_path=temp_path, auto_persist=False)
+        concern = ledger1.raise_concern(
+            ConcernCreate(
+                category=ConcernCategory.SAFETY_EVAL,
+                title="Persistent concern title",
+                description="This concern should persist across instances"
+            ),
+            "anon_1", SubmitterRole.WHISTLEBLOWER
+        )
+        ledger1.flush()
 
-            # Load in new instance
-            ledger2 = TransparencyLedger(storage_path=temp_path)
-            retrieved = ledger2.get_concern(concern.id)
+        # Load in new instance
+        ledger2 = TransparencyLedger(storage_path=temp_path)
+        retrieved = ledger2.get_concern(concern.id)
 
-            assert retrieved is not None
-            assert retrieved.title == "Persistent concern title"
+        assert retrieved is not None
+        assert retrieved.title == "Persistent concern title"
 
-        finally:
-            if os.path.exists(temp_path):
-                os.remove(temp_path)
+    def test_deferred_writes_need_flush(self, tmp_path):
+        """With auto_persist off, nothing reaches disk until flush()."""
+        temp_path = str(tmp_path / "ledger.json")
 
-    def test_reset(self, temp_ledger):
-        """Reset should clear all data."""
-        temp_ledger.raise_concern(
+        ledger = TransparencyLedger(storage_path=temp_path, auto_persist=False)
+        ledger.raise_concern(
             ConcernCreate(
                 category=ConcernCategory.OTHER,
-                title="Test concern title",
-                description="This is a detailed test description"
+                title="Deferred concern title",
+                description="This concern is written only on flush"
             ),
             "anon_1", SubmitterRole.WHISTLEBLOWER
         )
 
+        assert not (tmp_path / "ledger.json").exists()
+
+        ledger.flush()
+
+        assert len(TransparencyLedger(storage_path=temp_path).concerns) == 1
+
+    def test_writes_through_by_default(self, tmp_path):
+        """Each mutation is on disk as soon as it returns, without flush()."""
+        temp_path = str(tmp_path / "ledger.json")
+
+        ledger = TransparencyLedger(storage_path=temp_path)
+        concern = ledger.raise_concern(_BASE, "anon_1", SubmitterRole.WHISTLEBLOWER)
+
+        assert list(TransparencyLedger(storage_path=temp_path).concerns) == [concern.id]
+
+    def test_batch_size_triggers_flush(self, tmp_path):
+        """Pending mutations are written once batch_size is reached."""
+        temp_path = tmp_path / "ledger.json"
+
+        ledger = TransparencyLedger(storage_path=str(temp_path), batch_size=2)
+        ledger.raise_concern(_BASE, "anon_1", SubmitterRole.WHISTLEBLOWER)
+        assert not temp_path.exists()
+
+        ledger.raise_concern(_BASE, "anon_2", SubmitterRole.WHISTLEBLOWER)
+        assert len(TransparencyLedger(storage_path=str(temp_path)).concerns) == 2
+
+    def test_log_replays_updates_over_snapshot(self, tmp_path):
+        """Status changes appended to the log are replayed on load."""
+        temp_path = str(tmp_path / "ledger.json")
+
+        with TransparencyLedger(storage_path=temp_path) as ledger1:
+            concern = ledger1.raise_concern(_BASE, "anon_1", SubmitterRole.WHISTLEBLOWER)
+            ledger1.compact()
+            ledger1.dispute_response(concern.id, "anon_1")
+
+        assert (tmp_path / "ledger.json.log").exists()
+
+        ledger2 = TransparencyLedger(storage_path=temp_path)
+        assert ledger2.get_concern(concern.id).status == ConcernStatus.DISPUTED
+
+    def test_log_ignores_torn_final_line(self, tmp_path):
+        """A partially written last log entry is dropped without losing later writes."""
+        temp_path = str(tmp_path / "ledger.json")
+
+        with TransparencyLedger(storage_path=temp_path) as ledger1:
+            concern = ledger1.raise_concern(_BASE, "anon_1", SubmitterRole.WHISTLEBLOWER)
+        with open(tmp_path / "ledger.json.log", 'ab') as f:
+            f.write(b'{"op": "put", "collection": "conc')
+
+        with TransparencyLedger(storage_path=temp_path) as ledger2:
+            assert list(ledger2.concerns) == [concern.id]
+            later = [
+                ledger2.raise_concern(_BASE, f"anon_{i}", SubmitterRole.WHISTLEBLOWER)
+                for i in (2, 3)
+            ]
+
+        ledger3 = TransparencyLedger(storage_path=temp_path)
+        assert list(ledger3.concerns) == [concern.id] + [c.id for c in later]
+
+    def test_compact_folds_log_into_snapshot(self, tmp_path):
+        """Compaction writes a snapshot and removes the log."""
+        temp_path = str(tmp_path / "ledger.json")
+
+        ledger = TransparencyLedger(storage_path=temp_path)
+        ledger.raise_concern(_BASE, "anon_1", SubmitterRole.WHISTLEBLOWER)
+        assert (tmp_path / "ledger.json.log").exists()
+
+        ledger.compact()
+
+        assert not (tmp_path / "ledger.json.log").exists()
+        assert len(TransparencyLedger(storage_path=temp_path).concerns) == 1
+
+    def test_reset(self, temp_ledger):
+        """Reset should clear all data, including previously computed gate results."""
+        temp_ledger.raise_concern(
+            _BASE.model_copy(update={"deployment_id": DEP1}),
+            "anon_1", SubmitterRole.WHISTLEBLOWER
+        )
+        before = temp_ledger.get_deployment_compliance_status(DEP1, MOD1)
+
         assert len(temp_ledger.concerns) == 1
+        assert before.open_concerns == 1
 
         temp_ledger.reset()
 
         assert len(temp_ledger.concerns) == 0
         assert len(temp_ledger.responses) == 0
         assert len(temp_ledger.resolutions) == 0
+        assert temp_ledger.root_hash() is None
+        after = temp_ledger.get_deployment_compliance_status(DEP1, MOD1)
+        assert after == TransparencyLedger(storage_path=None).get_deployment_compliance_status(DEP1, MOD1)
+        assert after.open_concerns == 0
 
 
 class TestTamperProofing:
     """Tests for hash chain integrity."""
 
-    def test_concerns_have_hashes(self, temp_ledger):
+    def test_concerns_have_hashes(self, sample_concern):
         """Each concern should have a hash."""
-        concern = temp_ledger.raise_concern(
-            ConcernCreate(
-                category=ConcernCategory.SAFETY_EVAL,
-                title="Test concern title",
-                description="This is a detailed test description"
-            ),
-            "anon_1", SubmitterRole.WHISTLEBLOWER
-        )
-
-        assert concern.hash is not None
-        assert len(concern.hash) == 64  # SHA256 hex
+        assert sample_concern.hash is not None
+        assert len(sample_concern.hash) == 64  # SHA256 hex
 
     def test_different_concerns_different_hashes(self, temp_ledger):
         """Different concerns should have different hashes."""
@@ -445,6 +562,65 @@ class TestTamperProofing:
 
         assert c1.hash != c2.hash
 
+    def test_concern_hash_detects_field_change(self, temp_ledger, sample_concern):
+        """Recomputing the hash over a modified record should not match."""
+        record = dict(temp_ledger.concerns[sample_concern.id])
+        assert TransparencyLedger._compute_concern_hash(record) == sample_concern.hash
+
+        record["title"] = "Tampered concern title"
+        assert TransparencyLedger._compute_concern_hash(record) != sample_concern.hash
+
+    @pytest.mark.parametrize("changes,other", [
+        (
+            {"title": "Hello\x1fworld", "description": "tail text here"},
+            {"title": "Hello", "description": "world\x1ftail text here"},
+        ),
+        ({"title": "Hello world", "description": "tail"}, {"title": "Hello", "description": " worldtail"}),
+        ({"evidence_hash": None}, {"evidence_hash": ""}),
+        ({"deployment_id": None, "model_id": ""}, {"deployment_id": "", "model_id": None}),
+    ], ids=["separator_in_text", "shifted_boundary", "none_vs_empty", "none_moved"])
+    def test_concern_hash_field_boundaries(self, temp_ledger, sample_concern, changes, other):
+        """Moving bytes between fields, or None to "", must change the hash."""
+        record = temp_ledger.concerns[sample_concern.id]
+        compute = TransparencyLedger._compute_concern_hash
+        assert compute({**record, **changes}) != compute({**record, **other})
+
+    @pytest.mark.parametrize("n", range(1, 10))
+    def test_root_hash_matches_merkle_tree(self, temp_ledger, n):
+        """The incremental root should equal a full tree over the concern hashes for any size."""
+        assert temp_ledger.root_hash() is None
+
+        created = [
+            temp_ledger.raise_concern(_BASE, f"anon_{i}", SubmitterRole.WHISTLEBLOWER)
+            for i in range(n)
+        ]
+
+        tree = MerkleTree([c.hash for c in created])
+        root = temp_ledger.root_hash()
+        assert root == tree.get_root()
+        assert temp_ledger.get_stats()["merkle_root"] == root
+        assert MerkleTree.verify_proof(created[-1].hash, tree.get_proof(n - 1), root)
+
+    def test_root_hash_survives_reload(self, tmp_path):
+        """The frontier is rebuilt from stored concerns on load."""
+        temp_path = str(tmp_path / "ledger.json")
+
+        with TransparencyLedger(storage_path=temp_path) as ledger1:
+            for i in range(3):
+                ledger1.raise_concern(_BASE, f"anon_{i}", SubmitterRole.WHISTLEBLOWER)
+
+        ledger2 = TransparencyLedger(storage_path=temp_path)
+        assert ledger2.root_hash() == ledger1.root_hash()
+
+    @pytest.mark.parametrize("n", [1, 2, 5, 8, 13])
+    def test_batch_frontier_matches_appends(self, temp_ledger, n):
+        """Building the frontier in one batch should equal leaf-by-leaf appends."""
+        leaves = [_id(f"leaf_{i}", "salt") for i in range(n)]
+        for leaf in leaves:
+            temp_ledger._append_leaf(leaf)
+
+        assert TransparencyLedger._build_frontier(leaves) == temp_ledger._frontier
+
 
 # ============================================================
 # Compliance Submission Tests
@@ -462,7 +638,7 @@ class TestComplianceSubmission:
                 model_id="model-v1",
                 title="Pre-deployment Safety Evaluation",
                 summary="Comprehensive safety evaluation covering all benchmarks.",
-                evidence_hash="a" * 64,
+                evidence_hash=_HASH_A,
                 metadata={"test_cases": 15000, "score": 0.98}
             ),
             lab_id="Anthropic"
@@ -471,7 +647,7 @@ class TestComplianceSubmission:
         assert submission.id is not None
         assert submission.template_type == ComplianceTemplateType.SAFETY_EVALUATION
         assert submission.status == ComplianceStatus.SUBMITTED
-        assert submission.evidence_hash == "a" * 64
+        assert submission.evidence_hash == _HASH_A
         assert submission.lab_id == "Anthropic"
         assert submission.hash is not None
 
@@ -480,11 +656,11 @@ class TestComplianceSubmission:
         created = temp_ledger.submit_compliance(
             ComplianceSubmissionCreate(
                 template_type=ComplianceTemplateType.RED_TEAM_REPORT,
-                deployment_id="deploy-1",
-                model_id="model-1",
+                deployment_id=DEP1,
+                model_id=MOD1,
                 title="Red Team Testing Results",
                 summary="Results from external red team evaluation.",
-                evidence_hash="b" * 64
+                evidence_hash=_HASH_B
             ),
             lab_id="TestLab"
         )
@@ -494,6 +670,51 @@ class TestComplianceSubmission:
         assert retrieved.id == created.id
         assert retrieved.title == created.title
 
+        # Returned models are read-only snapshots of the stored record
+        with pytest.raises(ValueError):
+            retrieved.status = ComplianceStatus.VERIFIED
+        assert temp_ledger.get_compliance_submission(created.id).status == ComplianceStatus.SUBMITTED
+
+    @pytest.mark.parametrize("metadata", [
+        {"n": 2**70},
+        {"nested": [{"n": -2**64}]},
+        {"score": float("nan")},
+        {"score": float("inf")},
+    ], ids=["wide_int", "nested_wide_int", "nan", "inf"])
+    def test_unstorable_metadata_rejected(self, metadata):
+        """Metadata the store cannot encode losslessly is rejected at the model boundary."""
+        with pytest.raises(ValueError):
+            ComplianceSubmissionCreate(
+                template_type=ComplianceTemplateType.SAFETY_EVALUATION,
+                deployment_id=DEP1,
+                model_id=MOD1,
+                title="Safety Evaluation",
+                summary="Safety evaluation with metadata.",
+                evidence_hash=_HASH_A,
+                metadata=metadata
+            )
+
+    def test_wide_metadata_persists(self, tmp_path):
+        """64-bit metadata values survive a flush and reload unchanged."""
+        path = str(tmp_path / "ledger.json")
+        metadata = {"max": 2**64 - 1, "min": -2**63, "score": 0.98}
+        with TransparencyLedger(storage_path=path) as ledger1:
+            submission = ledger1.submit_compliance(
+                ComplianceSubmissionCreate(
+                    template_type=ComplianceTemplateType.SAFETY_EVALUATION,
+                    deployment_id=DEP1,
+                    model_id=MOD1,
+                    title="Safety Evaluation",
+                    summary="Safety evaluation with metadata.",
+                    evidence_hash=_HASH_A,
+                    metadata=metadata
+                ),
+                lab_id="TestLab"
+            )
+
+        ledger2 = TransparencyLedger(storage_path=path)
+        assert ledger2.get_compliance_submission(submission.id).metadata == metadata
+
     def test_get_nonexistent_submission(self, temp_ledger):
         """Should return None for invalid ID."""
         result = temp_ledger.get_compliance_submission("nonexistent")
@@ -508,7 +729,7 @@ class TestComplianceSubmission:
                 model_id="model-a",
                 title="Safety Eval A",
                 summary="Safety evaluation for deployment A.",
-                evidence_hash="a" * 64
+                evidence_hash=_HASH_A
             ),
             lab_id="Lab1"
         )
@@ -519,7 +740,7 @@ class TestComplianceSubmission:
                 model_id="model-b",
                 title="Safety Eval B",
                 summary="Safety evaluation for deployment B.",
-                evidence_hash="b" * 64
+                evidence_hash=_HASH_B
             ),
             lab_id="Lab2"
         )
@@ -533,22 +754,22 @@ class TestComplianceSubmission:
         temp_ledger.submit_compliance(
             ComplianceSubmissionCreate(
                 template_type=ComplianceTemplateType.SAFETY_EVALUATION,
-                deployment_id="deploy-1",
-                model_id="model-1",
+                deployment_id=DEP1,
+                model_id=MOD1,
                 title="Safety Eval",
                 summary="Safety evaluation submission.",
-                evidence_hash="a" * 64
+                evidence_hash=_HASH_A
             ),
             lab_id="Lab1"
         )
         temp_ledger.submit_compliance(
             ComplianceSubmissionCreate(
                 template_type=ComplianceTemplateType.RED_TEAM_REPORT,
-                deployment_id="deploy-1",
-                model_id="model-1",
+                deployment_id=DEP1,
+                model_id=MOD1,
                 title="Red Team",
                 summary="Red team report submission.",
-                evidence_hash="b" * 64
+                evidence_hash=_HASH_B
             ),
             lab_id="Lab1"
         )
@@ -559,6 +780,96 @@ class TestComplianceSubmission:
         assert len(safety_evals) == 1
         assert safety_evals[0].template_type == ComplianceTemplateType.SAFETY_EVALUATION
 
+    def test_list_submissions_combined_filters(self, temp_ledger):
+        """Deployment, template, lab and status filters should all apply together."""
+        for deployment_id, template_type, lab_id in [
+            ("deploy-a", ComplianceTemplateType.SAFETY_EVALUATION, "Lab1"),
+            ("deploy-a", ComplianceTemplateType.RED_TEAM_REPORT, "Lab1"),
+            ("deploy-a", ComplianceTemplateType.SAFETY_EVALUATION, "Lab2"),
+            ("deploy-b", ComplianceTemplateType.SAFETY_EVALUATION, "Lab1"),
+        ]:
+            temp_ledger.submit_compliance(
+                ComplianceSubmissionCreate(
+                    template_type=template_type,
+                    deployment_id=deployment_id,
+                    model_id=MOD1,
+                    title=f"{template_type.value} submission",
+                    summary=f"Submission for {template_type.value}.",
+                    evidence_hash=_HASH_A
+                ),
+                lab_id=lab_id
+            )
+
+        matched = temp_ledger.list_compliance_submissions(
+            deployment_id="deploy-a",
+            lab_id="Lab1",
+            template_type=ComplianceTemplateType.SAFETY_EVALUATION,
+            status=ComplianceStatus.SUBMITTED
+        )
+        assert len(matched) == 1
+        assert (matched[0].deployment_id, matched[0].lab_id) == ("deploy-a", "Lab1")
+
+        assert temp_ledger.list_compliance_submissions(
+            deployment_id="deploy-a",
+            status=ComplianceStatus.VERIFIED
+        ) == []
+
+        # Unindexed filters alone fall back to a full scan
+        assert len(temp_ledger.list_compliance_submissions(lab_id="Lab1")) == 3
+        assert len(temp_ledger.list_compliance_submissions(
+            lab_id="Lab1",
+            status=ComplianceStatus.SUBMITTED
+        )) == 3
+
+    def test_bulk_submit_compliance(self, tmp_path):
+        """Bulk submission reviews each paired submission and persists the whole batch."""
+        temp_path = str(tmp_path / "ledger.json")
+        ledger = TransparencyLedger(storage_path=temp_path)
+        safety = ComplianceSubmissionCreate(
+            template_type=ComplianceTemplateType.SAFETY_EVALUATION,
+            deployment_id=DEP1,
+            model_id=MOD1,
+            title="Safety Evaluation",
+            summary="Safety evaluation for the bulk batch.",
+            evidence_hash=_HASH_A
+        )
+        red_team = safety.model_copy(update={"template_type": ComplianceTemplateType.RED_TEAM_REPORT})
+
+        created = ledger.bulk_submit_compliance(
+            [(safety, _VERIFIED), (red_team, None)],
+            lab_id="TestLab",
+            auditor_id="Auditor"
+        )
+
+        assert [s.status for s in created] == [ComplianceStatus.VERIFIED, ComplianceStatus.SUBMITTED]
+        assert created[0].reviewed_by == "Auditor"
+        assert [ledger.get_compliance_submission(s.id) for s in created] == created
+
+        ledger.flush()
+
+        reloaded = TransparencyLedger(storage_path=temp_path)
+        assert [reloaded.get_compliance_submission(s.id) for s in created] == created
+
+    def test_bulk_submit_rejects_invalid_review_before_inserting(self, temp_ledger):
+        """An invalid review status fails the whole batch without storing anything."""
+        submission = ComplianceSubmissionCreate(
+            template_type=ComplianceTemplateType.SAFETY_EVALUATION,
+            deployment_id=DEP1,
+            model_id=MOD1,
+            title="Safety Evaluation",
+            summary="Safety evaluation for the bulk batch.",
+            evidence_hash=_HASH_A
+        )
+        invalid = _VERIFIED.model_copy(update={"status": ComplianceStatus.SUBMITTED})
+
+        with pytest.raises(ValueError):
+            temp_ledger.bulk_submit_compliance(
+                [(submission, _VERIFIED), (submission, invalid)],
+                lab_id="TestLab",
+                auditor_id="Auditor"
+            )
+        assert temp_ledger.compliance_submissions == {}
+
 
 class TestComplianceReview:
     """Tests for compliance review by auditors."""
@@ -568,11 +879,11 @@ class TestComplianceReview:
         submission = temp_ledger.submit_compliance(
             ComplianceSubmissionCreate(
                 template_type=ComplianceTemplateType.CAPABILITY_ASSESSMENT,
-                deployment_id="deploy-1",
-                model_id="model-1",
+                deployment_id=DEP1,
+                model_id=MOD1,
                 title="Capability Assessment",
                 summary="Assessment of dangerous capabilities.",
-                evidence_hash="c" * 64
+                evidence_hash=_HASH_C
             ),
             lab_id="TestLab"
         )
@@ -597,11 +908,11 @@ class TestComplianceReview:
         submission = temp_ledger.submit_compliance(
             ComplianceSubmissionCreate(
                 template_type=ComplianceTemplateType.TRAINING_DATA,
-                deployment_id="deploy-1",
-                model_id="model-1",
+                deployment_id=DEP1,
+                model_id=MOD1,
                 title="Training Data Documentation",
                 summary="Documentation of training data sources.",
-                evidence_hash="d" * 64
+                evidence_hash=_HASH_D
             ),
             lab_id="TestLab"
         )
@@ -636,11 +947,11 @@ class TestComplianceReview:
         submission = temp_ledger.submit_compliance(
             ComplianceSubmissionCreate(
                 template_type=ComplianceTemplateType.HUMAN_OVERSIGHT,
-                deployment_id="deploy-1",
-                model_id="model-1",
+                deployment_id=DEP1,
+                model_id=MOD1,
                 title="Human Oversight Attestation",
                 summary="Attestation of human oversight procedures.",
-                evidence_hash="e" * 64
+                evidence_hash=_HASH_E
             ),
             lab_id="TestLab"
         )
@@ -666,11 +977,86 @@ class TestDeploymentComplianceStatus:
         model_id = "model-cleared"
 
         # Submit and verify all required templates
-        for template_type in [
-            ComplianceTemplateType.SAFETY_EVALUATION,
-            ComplianceTemplateType.CAPABILITY_ASSESSMENT,
-            ComplianceTemplateType.RED_TEAM_REPORT
-        ]:
+        temp_ledger.bulk_submit_compliance(
+            [
+                (
+                    ComplianceSubmissionCreate(
+                        template_type=template_type,
+                        deployment_id=deployment_id,
+                        model_id=model_id,
+                        title=f"{template_type.value} submission",
+                        summary=f"Submission for {template_type.value}.",
+                        evidence_hash=_HASH_A
+                    ),
+                    _VERIFIED
+                )
+                for template_type in DEFAULT_REQUIRED_TEMPLATES
+            ],
+            lab_id="TestLab",
+            auditor_id="Auditor"
+        )
+
+        status = temp_ledger.get_deployment_compliance_status(deployment_id, model_id)
+
+        assert status.is_cleared is True
+        assert status.compliance_complete is True
+        assert status.concerns_resolved is True
+        assert len(status.missing_templates) == 0
+        assert "CLEARED" in status.message
+
+    def test_other_model_submissions_do_not_count(self, temp_ledger):
+        """Verified submissions for a different model should not clear the gate."""
+        sub = temp_ledger.submit_compliance(
+            ComplianceSubmissionCreate(
+                template_type=ComplianceTemplateType.SAFETY_EVALUATION,
+                deployment_id="deploy-shared",
+                model_id="model-old",
+                title="Old model safety eval",
+                summary="Safety evaluation for the old model.",
+                evidence_hash=_HASH_A
+            ),
+            lab_id="TestLab"
+        )
+        temp_ledger.review_compliance(
+            ComplianceReviewCreate(
+                submission_id=sub.id,
+                status=ComplianceStatus.VERIFIED,
+                notes="Verified and approved.",
+                evidence_verified=True
+            ),
+            auditor_id="Auditor"
+        )
+
+        status = temp_ledger.get_deployment_compliance_status("deploy-shared", "model-new")
+
+        assert status.submitted_templates == ()
+        assert ComplianceTemplateType.SAFETY_EVALUATION in status.missing_templates
+
+    def test_gate_memoized_until_mutation(self, temp_ledger):
+        """Repeated gate queries reuse the result until the ledger changes."""
+        first = temp_ledger.get_deployment_compliance_status("deploy-memo", "model-memo")
+        assert temp_ledger.get_deployment_compliance_status("deploy-memo", "model-memo") is first
+
+        # The shared instance cannot be altered by one caller for the others
+        with pytest.raises(ValueError):
+            first.message = "CLEARED for deployment."
+        with pytest.raises(AttributeError):
+            first.missing_templates.append(ComplianceTemplateType.TRAINING_DATA)
+
+        temp_ledger.raise_concern(
+            _BASE.model_copy(update={"deployment_id": "deploy-memo"}),
+            "anon_1", SubmitterRole.WHISTLEBLOWER
+        )
+
+        updated = temp_ledger.get_deployment_compliance_status("deploy-memo", "model-memo")
+        assert updated is not first
+        assert updated.open_concerns == 1
+
+    def test_is_deployment_cleared_agrees_with_gate(self, temp_ledger):
+        """The boolean fast path matches the full gate as the ledger changes."""
+        deployment_id, model_id = "deploy-fast", "model-fast"
+
+        def review(template_type, status):
             sub = temp_ledger.submit_compliance(
                 ComplianceSubmissionCreate(
                     template_type=template_type,
@@ -678,27 +1064,47 @@ class TestDeploymentComplianceStatus:
                     model_id=model_id,
                     title=f"{template_type.value} submission",
                     summary=f"Submission for {template_type.value}.",
-                    evidence_hash="a" * 64
+                    evidence_hash=_HASH_A
                 ),
                 lab_id="TestLab"
             )
             temp_ledger.review_compliance(
                 ComplianceReviewCreate(
                     submission_id=sub.id,
-                    status=ComplianceStatus.VERIFIED,
-                    notes="Verified and approved.",
-                    evidence_verified=True
+                    status=status,
+                    notes="Reviewed by the auditor.",
+                    evidence_verified=status == ComplianceStatus.VERIFIED
                 ),
                 auditor_id="Auditor"
             )
 
-        status = temp_ledger.get_deployment_compliance_status(deployment_id, model_id)
+        def assert_agrees(expected):
+            gate = temp_ledger.get_deployment_compliance_status(deployment_id, model_id)
+            assert gate.is_cleared is expected
+            assert temp_ledger.is_deployment_cleared(deployment_id, model_id) is expected
 
-        assert status.is_cleared is True
-        assert status.compliance_complete is True
-        assert status.concerns_resolved is True
-        assert len(status.missing_templates) == 0
-        assert "CLEARED" in status.message
+        assert_agrees(False)
+        for template_type in DEFAULT_REQUIRED_TEMPLATES:
+            review(template_type, ComplianceStatus.VERIFIED)
+        assert_agrees(True)
+
+        concern = temp_ledger.raise_concern(
+            _BASE.model_copy(update={"deployment_id": deployment_id}),
+            "anon_1", SubmitterRole.WHISTLEBLOWER
+        )
+        assert_agrees(False)
+
+        temp_ledger.resolve_concern(
+            ResolutionCreate(
+                concern_id=concern.id,
+                resolution_notes="Concern investigated and closed."
+            ),
+            "Auditor"
+        )
+        assert_agrees(True)
+
+        review(ComplianceTemplateType.SAFETY_EVALUATION, ComplianceStatus.REJECTED)
+        assert_agrees(False)
 
     def test_blocked_when_missing_templates(self, temp_ledger):
         """Deployment should be blocked when required templates are missing."""
@@ -713,7 +1119,7 @@ class TestDeploymentComplianceStatus:
                 model_id=model_id,
                 title="Safety Evaluation",
                 summary="Safety evaluation submission.",
-                evidence_hash="a" * 64
+                evidence_hash=_HASH_A
             ),
             lab_id="TestLab"
         )
@@ -743,31 +1149,24 @@ class TestDeploymentComplianceStatus:
         model_id = "model-concerns"
 
         # Submit and verify all required templates
-        for template_type in [
-            ComplianceTemplateType.SAFETY_EVALUATION,
-            ComplianceTemplateType.CAPABILITY_ASSESSMENT,
-            ComplianceTemplateType.RED_TEAM_REPORT
-        ]:
-            sub = temp_ledger.submit_compliance(
-                ComplianceSubmissionCreate(
-                    template_type=template_type,
-                    deployment_id=deployment_id,
-                    model_id=model_id,
-                    title=f"{template_type.value} submission",
-                    summary=f"Submission for {template_type.value}.",
-                    evidence_hash="a" * 64
-                ),
-                lab_id="TestLab"
-            )
-            temp_ledger.review_compliance(
-                ComplianceReviewCreate(
-                    submission_id=sub.id,
-                    status=ComplianceStatus.VERIFIED,
-                    notes="Verified and approved.",
-                    evidence_verified=True
-                ),
-                auditor_id="Auditor"
-            )
+        temp_ledger.bulk_submit_compliance(
+            [
+                (
+                    ComplianceSubmissionCreate(
+                        template_type=template_type,
+                        deployment_id=deployment_id,
+                        model_id=model_id,
+                        title=f"{template_type.value} submission",
+                        summary=f"Submission for {template_type.value}.",
+                        evidence_hash=_HASH_A
+                    ),
+                    _VERIFIED
+                )
+                for template_type in DEFAULT_REQUIRED_TEMPLATES
+            ],
+            lab_id="TestLab",
+            auditor_id="Auditor"
+        )
 
         # Add an unresolved concern
         temp_ledger.raise_concern(
@@ -803,7 +1202,7 @@ class TestDeploymentComplianceStatus:
                 model_id=model_id,
                 title="Safety Evaluation",
                 summary="Safety evaluation submission.",
-                evidence_hash="a" * 64
+                evidence_hash=_HASH_A
             ),
             lab_id="TestLab"
         )
@@ -829,36 +1228,31 @@ class TestDeploymentComplianceStatus:
 class TestCompliancePersistence:
     """Tests for compliance submission persistence."""
 
-    def test_compliance_persistence(self):
+    def test_compliance_persistence(self, tmp_path):
         """Compliance submissions should persist across instances."""
-        with tempfile.NamedTemporaryFile(suffix='.json', delete=False) as f:
-            temp_path = f.name
-
-        try:
-            # Create ledger and add submission
-            ledger1 = TransparencyLedger(storage_path=temp_path)
-            submission = ledger1.submit_compliance(
-                ComplianceSubmissionCreate(
-                    template_type=ComplianceTemplateType.INCIDENT_REPORT,
-                    deployment_id="deploy-persist",
-                    model_id="model-persist",
-                    title="Persistent Incident Report",
-                    summary="This submission should persist across instances.",
-                    evidence_hash="f" * 64
-                ),
-                lab_id="TestLab"
-            )
+        temp_path = str(tmp_path / "ledger.json")
 
-            # Load in new instance
-            ledger2 = TransparencyLedger(storage_path=temp_path)
-            retrieved = ledger2.get_compliance_submission(submission.id)
+        # Create ledger and add submission
+        ledger1 = TransparencyLedger(storage_path=temp_path)
+        submission = ledger1.submit_compliance(
+            ComplianceSubmissionCreate(
+                template_type=ComplianceTemplateType.INCIDENT_REPORT,
+                deployment_id="deploy-persist",
+                model_id="model-persist",
+                title="Persistent Incident Report",
+                summary="This submission should persist across instances.",
+                evidence_hash=_HASH_F
+            ),
+            lab_id="TestLab"
+        )
+        ledger1.flush()
 
-            assert retrieved is not None
-            assert retrieved.title == "Persistent Incident Report"
+        # Load in new instance
+        ledger2 = TransparencyLedger(storage_path=temp_path)
+        retrieved = ledger2.get_compliance_submission(submission.id)
 
-        finally:
-            if os.path.exists(temp_path):
-                os.remove(temp_path)
+        assert retrieved is not None
+        assert retrieved.title == "Persistent Incident Report"
 
     def test_reset_clears_compliance(self, temp_ledger):
         """Reset should clear compliance submissions."""
@@ -869,7 +1263,7 @@ class TestCompliancePersistence:
                 model_id="model-reset",
                 title="To be deleted",
                 summary="This will be cleared on reset.",
-                evidence_hash="g" * 64
+                evidence_hash=_HASH_A
             ),
             lab_id="TestLab"
         )
@@ -879,3 +1273,27 @@ class TestCompliancePersistence:
         temp_ledger.reset()
 
         assert len(temp_ledger.compliance_submissions) == 0
+
+
+class TestInMemoryStorage:
+    """Tests for the in-memory (storage_path=None) ledger."""
+
+    def test_in_memory_ledger_skips_disk(self, tmp_path, monkeypatch):
+        """Ledger without a storage path keeps data in memory only."""
+        monkeypatch.chdir(tmp_path)
+        ledger = TransparencyLedger(storage_path=None)
+        concern = ledger.raise_concern(
+            ConcernCreate(
+                category=ConcernCategory.OTHER,
+                title="In-memory concern title",
+                description="This concern lives only in memory"
+            ),
+            "anon_1", SubmitterRole.WHISTLEBLOWER
+        )
+        ledger.dispute_response(concern.id, "anon_1")
+        ledger.flush()
+        ledger.compact()
+
+        assert ledger.get_concern(concern.id) is not None
+        assert list(tmp_path.iterdir()) == []
+        assert TransparencyLedger().concerns == {}
@@ -1,5 +1,8 @@
 """Tests for Zero-Knowledge proof module."""
 
+import base64
+import hashlib
+import json
 import os
 import tempfile
 
@@ -7,6 +10,7 @@ import pytest
 
 from backend.models import EventType
 from backend.zk_proofs import ZKCommitmentStore
+from tests.helpers import assert_hex_digest
 
 
 @pytest.fixture
@@ -26,8 +30,9 @@ def temp_zk_store():
     yield store
 
     # Cleanup
-    if os.path.exists(temp_path):
-        os.remove(temp_path)
+    for path in (temp_path, str(store.log_path)):
+        if os.path.exists(path):
+            os.remove(path)
 
 
 @pytest.fixture
@@ -45,8 +50,9 @@ def configurable_zk_store():
     store._counts = counts  # For test manipulation
     yield store
 
-    if os.path.exists(temp_path):
-        os.remove(temp_path)
+    for path in (temp_path, str(store.log_path)):
+        if os.path.exists(path):
+            os.remove(path)
 
 
 class TestCommitmentCreation:
@@ -69,7 +75,7 @@ class TestCommitmentCreation:
 
         # Hash should be valid SHA256 hex (64 chars)
         assert len(commitment.commitment_hash) == 64
-        assert all(c in '0123456789abcdef' for c in commitment.commitment_hash)
+        assert_hex_digest(commitment.commitment_hash)
 
         # The count is hidden - you cannot extract "count=5" from the hash
         # (Note: individual hex digits 0-9, a-f will appear, that's fine)
@@ -85,6 +91,18 @@ class TestCommitmentCreation:
         assert c1.commitment_hash != c2.commitment_hash
         assert c1.id != c2.id
 
+    def test_commitment_opens_to_stored_secrets(self, temp_zk_store):
+        """The commitment hash is SHA256 over the 8-byte count, blinding bytes and event type."""
+        commitment = temp_zk_store.create_commitment(EventType.SAFETY_EVAL_RUN)
+        stored = temp_zk_store.commitments[commitment.id]
+
+        buf = (
+            stored["_count"].to_bytes(8, "big")
+            + stored["_blinding"]
+            + EventType.SAFETY_EVAL_RUN.value.encode('utf-8')
+        )
+        assert hashlib.sha256(buf).hexdigest() == commitment.commitment_hash
+
     def test_get_commitment(self, temp_zk_store):
         """Should retrieve a commitment by ID."""
         created = temp_zk_store.create_commitment(EventType.SAFETY_EVAL_RUN)
@@ -174,6 +192,35 @@ class TestProofVerification:
         assert is_valid is False
         assert "error" in message.lower() or "failed" in message.lower()
 
+    def test_verify_rejects_non_string_verification_hash(self, temp_zk_store):
+        """A malformed JSON verification hash is rejected rather than raising."""
+        commitment = temp_zk_store.create_commitment(EventType.SAFETY_EVAL_RUN)
+        proof = temp_zk_store.generate_proof(commitment.id, threshold=3)
+
+        is_valid, message = ZKCommitmentStore.verify_proof(
+            commitment_hash=commitment.commitment_hash,
+            threshold=proof.threshold,
+            excess_commitment=proof.excess_commitment,
+            proof_data={**proof.proof_data, "verification_hash": [1]}
+        )
+
+        assert is_valid is False
+        assert "mismatch" in message.lower()
+
+    def test_verify_accepts_any_threshold_blinding_value(self, temp_zk_store):
+        """Only the presence of threshold_blinding is checked, as before caching."""
+        commitment = temp_zk_store.create_commitment(EventType.SAFETY_EVAL_RUN)
+        proof = temp_zk_store.generate_proof(commitment.id, threshold=3)
+
+        is_valid, _ = ZKCommitmentStore.verify_proof(
+            commitment_hash=commitment.commitment_hash,
+            threshold=proof.threshold,
+            excess_commitment=proof.excess_commitment,
+            proof_data={**proof.proof_data, "threshold_blinding": [1]}
+        )
+
+        assert is_valid is True
+
     def test_verify_tampered_proof(self, temp_zk_store):
         """Should reject a proof with tampered data."""
         commitment = temp_zk_store.create_commitment(EventType.SAFETY_EVAL_RUN)
@@ -208,6 +255,38 @@ class TestProofVerification:
 
         assert is_valid is False
 
+    def test_verification_cache_remembers_only_valid_proofs(self, temp_zk_store):
+        """Valid proofs are cached; rejected ones are not, and reset clears the cache."""
+        temp_zk_store.reset()
+        commitment = temp_zk_store.create_commitment(EventType.SAFETY_EVAL_RUN)
+        proof = temp_zk_store.generate_proof(commitment.id, threshold=3)
+        args = (commitment.commitment_hash, proof.threshold, proof.excess_commitment)
+
+        tampered = {**proof.proof_data, "verification_hash": "0" * 64}
+        assert ZKCommitmentStore.verify_proof(*args, tampered)[0] is False
+        assert len(ZKCommitmentStore._verified_proofs) == 0
+
+        assert ZKCommitmentStore.verify_proof(*args, proof.proof_data)[0] is True
+        assert ZKCommitmentStore.verify_proof(*args, proof.proof_data)[0] is True
+        assert len(ZKCommitmentStore._verified_proofs) == 1
+
+        temp_zk_store.reset()
+        assert len(ZKCommitmentStore._verified_proofs) == 0
+
+    def test_verify_proofs_batch_preserves_order(self, temp_zk_store):
+        """Batch verification returns one result per proof, in input order."""
+        items = []
+        for threshold in range(1, 5):
+            commitment = temp_zk_store.create_commitment(EventType.SAFETY_EVAL_RUN)
+            proof = temp_zk_store.generate_proof(commitment.id, threshold=threshold)
+            items.append((commitment.commitment_hash, threshold, proof.excess_commitment, proof.proof_data))
+        items[2] = (*items[2][:3], {**items[2][3], "verification_hash": "0" * 64})
+
+        results = ZKCommitmentStore.verify_proofs_batch(items)
+
+        assert [valid for valid, _ in results] == [True, True, False, True]
+        assert results == [ZKCommitmentStore.verify_proof(*item) for item in items]
+
 
 class TestZKProperty:
     """Tests demonstrating the Zero-Knowledge property."""
@@ -260,7 +339,7 @@ class TestZKProperty:
 
         # The excess_commitment is a SHA256 hash (64 hex chars)
         assert len(proof.excess_commitment) == 64
-        assert all(c in '0123456789abcdef' for c in proof.excess_commitment)
+        assert_hex_digest(proof.excess_commitment)
 
         # The proof data values are all hashes (64 chars each)
         for key, value in proof.proof_data.items():
@@ -302,8 +381,60 @@ class TestPersistence:
             assert proof is not None
             assert proof.is_valid is True
         finally:
-            if os.path.exists(temp_path):
-                os.remove(temp_path)
+            for path in (temp_path, temp_path + ".log"):
+                if os.path.exists(path):
+                    os.remove(path)
+
+    def test_log_compacts_into_snapshot(self, tmp_path):
+        """Commitments land in the log until compaction folds them into the snapshot."""
+        store = ZKCommitmentStore(storage_path=str(tmp_path / "zk_store.json"))
+        commitment = store.create_commitment(EventType.SAFETY_EVAL_RUN)
+        assert store.log_path.exists()
+        assert not store.storage_path.exists()
+
+        store.compact()
+
+        assert not store.log_path.exists()
+        reloaded = ZKCommitmentStore(storage_path=str(store.storage_path))
+        assert reloaded.get_commitment(commitment.id) is not None
+
+    def test_log_ignores_torn_final_line(self, tmp_path):
+        """A partially written last log entry is dropped without losing later writes."""
+        temp_path = str(tmp_path / "zk_store.json")
+        store1 = ZKCommitmentStore(storage_path=temp_path)
+        commitment = store1.create_commitment(EventType.SAFETY_EVAL_RUN)
+        with open(store1.log_path, 'ab') as f:
+            f.write(b'{"op": "put", "rec')
+
+        store2 = ZKCommitmentStore(storage_path=temp_path)
+        assert list(store2.commitments) == [commitment.id]
+        later = [store2.create_commitment(EventType.SAFETY_EVAL_RUN) for _ in range(2)]
+
+        store3 = ZKCommitmentStore(storage_path=temp_path)
+        assert list(store3.commitments) == [commitment.id] + [c.id for c in later]
+
+    def test_loads_legacy_hex_blinding_factor(self, tmp_path):
+        """Snapshots written with hex blinding factors still produce proofs."""
+        temp_path = tmp_path / "zk_store.json"
+        temp_path.write_text(json.dumps({
+            "legacy": {
+                "id": "legacy",
+                "commitment_hash": "c" * 64,
+                "event_type": EventType.SAFETY_EVAL_RUN.value,
+                "timestamp": "2026-01-31T11:46:47.228902",
+                "_count": 5,
+                "_blinding_factor": "ab" * 32
+            }
+        }))
+
+        store = ZKCommitmentStore(storage_path=str(temp_path))
+        assert store.commitments["legacy"]["_blinding"] == bytes.fromhex("ab" * 32)
+        assert store.generate_proof("legacy", threshold=3).is_valid is True
+
+        store.compact()
+        stored = json.loads(temp_path.read_text())["legacy"]
+        assert "_blinding_factor" not in stored
+        assert base64.b64decode(stored["_blinding"]) == bytes.fromhex("ab" * 32)
 
     def test_reset(self, temp_zk_store):
         """Reset should clear all commitments."""